@@ -7,6 +7,7 @@ Provides multiple caching strategies:
 """
 
 import hashlib
+import os
 import pickle
 import threading
 from collections import OrderedDict
@@ -213,7 +214,8 @@ class FileCacheProvider:
                 with temp_file.open("wb") as f:
                     pickle.dump(entry, f)
 
-                temp_file.rename(cache_file)
+                # replace() overwrites an existing entry atomically on all platforms
+                temp_file.replace(cache_file)
 
                 # Cleanup old files if over limit
                 self._cleanup_old_files()
@@ -272,18 +274,31 @@ class FileCacheProvider:
 
     def _cleanup_old_files(self) -> None:
         """Remove oldest cache files if over the limit."""
-        cache_files = list(self._cache_dir.glob("*.cache"))
+        # One directory scan; each DirEntry keeps its stat result, so the sort
+        # below does not go back to the filesystem per file
+        with os.scandir(self._cache_dir) as entries:
+            cache_files = [
+                entry
+                for entry in entries
+                if entry.name.endswith(".cache") and entry.is_file(follow_symlinks=False)
+            ]
 
         if len(cache_files) <= self._max_files:
             return
 
-        # Sort by modification time (oldest first)
-        cache_files.sort(key=lambda f: f.stat().st_mtime)
+        # Collect modification times (files removed concurrently are skipped)
+        dated_files = []
+        for entry in cache_files:
+            try:
+                dated_files.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                continue
 
         # Remove oldest files
-        files_to_remove = len(cache_files) - self._max_files
-        for cache_file in cache_files[:files_to_remove]:
-            cache_file.unlink(missing_ok=True)
+        dated_files.sort()
+        files_to_remove = len(dated_files) - self._max_files
+        for _, path in dated_files[:files_to_remove]:
+            Path(path).unlink(missing_ok=True)
 
 
 class NoOpCacheProvider:
@@ -6,11 +6,15 @@ implementing the core business logic without depending on specific implementatio
 
 import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ..domain.entities import CensusDataPoint, CensusVariable, GeographicUnit
 from ..domain.interfaces import CensusDataDependencies
 
+# Upper bound on county-level Census API requests in flight at once
+_MAX_CONCURRENT_API_REQUESTS = 4
+
 
 class CensusService:
     """Main service for census data operations."""
@@ -185,12 +189,11 @@ class CensusService:
         self, geoids: list[str], variable_codes: list[str], year: int, dataset: str
     ) -> list[CensusDataPoint]:
         """Fetch data from Census API."""
-        data_points = []
-
         # Group GEOIDs by state and county for more specific API calls
         state_county_groups = self._group_geoids_by_state_and_county(geoids)
 
-        for (state_fips, county_fips) in state_county_groups:
+        def fetch_county(group: tuple[str, str]) -> list[CensusDataPoint]:
+            state_fips, county_fips = group
             self._rate_limiter.wait_if_needed("census_api")
 
             try:
@@ -207,20 +210,23 @@ class CensusService:
                 )
 
                 # Convert API response to domain entities
-                data_points.extend(
-                    self._convert_api_response(api_response, variable_codes, year, dataset)
-                )
+                return self._convert_api_response(api_response, variable_codes, year, dataset)
 
             except Exception as e:
                 self._logger.error(
                     f"API request failed for state {state_fips} county {county_fips}: {e}"
                 )
-                continue
+                return []
 
-        # Filter to only requested GEOIDs
-        filtered_data = [point for point in data_points if point.geoid in geoids]
+        # County requests are independent and network-bound, so a few run at once;
+        # the shared rate limiter still paces them
+        max_workers = min(_MAX_CONCURRENT_API_REQUESTS, len(state_county_groups)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            county_results = list(executor.map(fetch_county, state_county_groups))
 
-        return filtered_data
+        # Filter to only requested GEOIDs
+        requested = set(geoids)
+        return [point for points in county_results for point in points if point.geoid in requested]
 
     def _convert_api_response(
         self, api_response: dict[str, Any], variable_codes: list[str], year: int, dataset: str
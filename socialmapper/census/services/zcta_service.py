@@ -4,6 +4,7 @@ Handles ZIP Code Tabulation Area (ZCTA) operations including fetching boundaries
 batch processing, and TIGER/Line shapefile URL generation.
 """
 
+import hashlib
 import logging
 from collections.abc import Callable
 
@@ -304,8 +305,11 @@ class ZctaService:
         logger.info(f"Fetching census data for {len(geoids)} ZCTAs and {len(variables)} variables")
 
         # Check cache first
+        # Hash the sorted inputs with hashlib rather than hash(), which is salted
+        # per process and would make persistent cache entries unreachable
+        request_str = ",".join(sorted(geoids)) + "|" + ",".join(sorted(variables))
         cache_key = (
-            f"zcta_census_data_{hash(tuple(sorted(geoids)))}{hash(tuple(sorted(variables)))}"
+            f"zcta_census_data_{hashlib.blake2b(request_str.encode(), digest_size=16).hexdigest()}"
         )
         if self._cache:
             cached_data = self._cache.get(cache_key)
@@ -1,5 +1,7 @@
 """TIGER REST API client for fetching geometries."""
 
+import hashlib
+import io
 import logging
 
 # Avoid circular import - implement simple caching inline
@@ -406,8 +408,10 @@ class TigerGeometryClient:
         ]
 
         if query.geometry_ids and len(query.geometry_ids) > 0:
-            # Sort IDs for consistent key
-            ids_hash = hash(tuple(sorted(query.geometry_ids)))
+            # Sort IDs for consistent key; hashlib is stable across processes,
+            # unlike the salted built-in hash()
+            ids_str = ",".join(sorted(query.geometry_ids))
+            ids_hash = hashlib.blake2b(ids_str.encode(), digest_size=16).hexdigest()
             key_parts.append(f"ids_{ids_hash}")
 
         return "_".join(key_parts)
@@ -426,7 +430,11 @@ class TigerGeometryClient:
                 cached_data = pickle.load(f)
 
             # Reconstruct GeoDataFrame from cached data
-            gdf = gpd.read_file(cached_data["geodataframe"], driver="GeoJSON")
+            if "geoparquet" in cached_data:
+                gdf = gpd.read_parquet(io.BytesIO(cached_data["geoparquet"]))
+            else:
+                # Entries written before the GeoParquet format
+                gdf = gpd.read_file(cached_data["geodataframe"], driver="GeoJSON")
 
             return GeometryResult(
                 geodataframe=gdf,
@@ -447,9 +455,12 @@ class TigerGeometryClient:
         cache_file = self.cache_dir / f"{cache_key}.pkl"
 
         try:
-            # Convert to cacheable format
+            # Convert to cacheable format; GeoParquet avoids the cost of
+            # serializing every coordinate to GeoJSON text and parsing it back
+            buffer = io.BytesIO()
+            result.geodataframe.to_parquet(buffer, compression="snappy", index=False)
             cache_data = {
-                "geodataframe": result.geodataframe.to_json(),
+                "geoparquet": buffer.getvalue(),
                 "geography_level": result.geography_level.value,
                 "query": result.query.model_dump(),
                 "metadata": result.metadata,
@@ -3,14 +3,9 @@
 import logging
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-
-from ...visualization import ChoroplethMap, ColorScheme, MapConfig
 from .client import TigerGeometryClient
 from .models import GeographyLevel, GeometryQuery
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -91,6 +86,8 @@ def example_fetch_zctas():
 
 def example_visualize_counties_with_data():
     """Example: Visualize counties with mock demographic data."""
+    from ...visualization import ChoroplethMap, ColorScheme, MapConfig
+
     # Fetch counties
     client = TigerGeometryClient()
     result = client.fetch_counties(state_fips="06")
@@ -130,6 +127,8 @@ def example_visualize_counties_with_data():
 
 def example_multi_geography_visualization():
     """Example: Visualize multiple geography levels together."""
+    import matplotlib.pyplot as plt
+
     client = TigerGeometryClient()
 
     # Fetch Bay Area counties
@@ -234,6 +233,9 @@ def example_integration_with_census_data():
 
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, not on import
+    logging.basicConfig(level=logging.INFO)
+
     # Run examples
     print("=== Fetching California Counties ===")
     example_fetch_counties()
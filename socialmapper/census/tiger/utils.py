@@ -3,6 +3,7 @@
 import logging
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 from shapely.geometry import Point
 
@@ -311,6 +312,7 @@ def clip_geometries_to_boundary(
     gdf: gpd.GeoDataFrame,
     boundary: gpd.GeoDataFrame | gpd.GeoSeries,
     keep_all: bool = False,
+    use_sindex: bool = True,
 ) -> gpd.GeoDataFrame:
     """Clip geometries to a boundary.
 
@@ -318,6 +320,9 @@ def clip_geometries_to_boundary(
         gdf: GeoDataFrame to clip
         boundary: Boundary to clip to
         keep_all: If True, keep geometries that don't intersect
+        use_sindex: If True, find intersecting rows through the spatial index
+            of ``gdf`` instead of testing every geometry. Both paths select
+            the same rows.
 
     Returns:
         Clipped GeoDataFrame
@@ -332,15 +337,21 @@ def clip_geometries_to_boundary(
     else:
         boundary_geom = boundary.unary_union if len(boundary) > 1 else boundary.iloc[0]
 
+    # Find intersecting rows; the STRtree query prunes by bounding box before
+    # running the exact predicate, avoiding a linear scan of all geometries
+    if use_sindex:
+        intersects = np.zeros(len(gdf), dtype=bool)
+        intersects[gdf.sindex.query(boundary_geom, predicate="intersects")] = True
+    else:
+        intersects = gdf.geometry.intersects(boundary_geom).to_numpy()
+
     # Clip geometries
     if keep_all:
         # Keep all records, but clip geometries that intersect
         clipped = gdf.copy()
-        intersects = gdf.geometry.intersects(boundary_geom)
         clipped.loc[intersects, "geometry"] = gdf.loc[intersects].intersection(boundary_geom)
     else:
         # Only keep geometries that intersect
-        intersects = gdf.geometry.intersects(boundary_geom)
         clipped = gdf[intersects].copy()
         clipped["geometry"] = clipped.intersection(boundary_geom)
 
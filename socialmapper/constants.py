@@ -9,85 +9,89 @@ Categories:
 - Data Processing Thresholds
 - File & Network Configuration
 - Census & Geographic Identifiers
+
+All values are annotated ``Final`` so type checkers reject reassignment.
 """
 
+from typing import Final
+
 # =============================================================================
 # GEOGRAPHIC & COORDINATE CONSTANTS
 # =============================================================================
 
 # Geographic coordinate limits (WGS84)
-MIN_LATITUDE = -90.0
-MAX_LATITUDE = 90.0
-MIN_LONGITUDE = -180.0
-MAX_LONGITUDE = 180.0
+MIN_LATITUDE: Final = -90.0
+MAX_LATITUDE: Final = 90.0
+MIN_LONGITUDE: Final = -180.0
+MAX_LONGITUDE: Final = 180.0
 
 # Common coordinate reference systems
-WGS84_EPSG = 4326  # Standard GPS coordinates
-WEB_MERCATOR_EPSG = 3857  # Web mapping standard
+WGS84_EPSG: Final = 4326  # Standard GPS coordinates
+WEB_MERCATOR_EPSG: Final = 3857  # Web mapping standard
 
 # Geographic calculations
-DEGREES_PER_KM_AT_EQUATOR = 1.0 / 111.0  # Approximate conversion
-KM_PER_DEGREE_AT_EQUATOR = 111.0  # Approximate conversion
+DEGREES_PER_KM_AT_EQUATOR: Final = 1.0 / 111.0  # Approximate conversion
+KM_PER_DEGREE_AT_EQUATOR: Final = 111.0  # Approximate conversion
 
 # File system limits
-MAX_FILENAME_LENGTH = 255
-MIN_ASCII_PRINTABLE = 32
+MAX_FILENAME_LENGTH: Final = 255
+MIN_ASCII_PRINTABLE: Final = 32
 
 # Address validation
-MIN_ADDRESS_LENGTH = 3
-MAX_VARIABLE_NAME_LENGTH = 50
+MIN_ADDRESS_LENGTH: Final = 3
+MAX_VARIABLE_NAME_LENGTH: Final = 50
 
 # Data validation
-MIN_CLUSTER_POINTS = 2
-MIN_GEOJSON_COORDINATES = 2
+MIN_CLUSTER_POINTS: Final = 2
+MIN_GEOJSON_COORDINATES: Final = 2
 
 # HTTP status codes
-HTTP_TOO_MANY_REQUESTS = 429
-HTTP_SERVER_ERROR_START = 500
-HTTP_SERVER_ERROR_END = 600
+HTTP_TOO_MANY_REQUESTS: Final = 429
+HTTP_SERVER_ERROR_START: Final = 500
+HTTP_SERVER_ERROR_END: Final = 600
 
 # System resource thresholds (in GB)
-LOW_MEMORY_THRESHOLD = 4.0
-HIGH_MEMORY_THRESHOLD = 16.0
-ENTERPRISE_MEMORY_THRESHOLD = 32.0
+LOW_MEMORY_THRESHOLD: Final = 4.0
+HIGH_MEMORY_THRESHOLD: Final = 16.0
+ENTERPRISE_MEMORY_THRESHOLD: Final = 32.0
 
 # CPU core thresholds
-MIN_CPU_CORES = 2
-RECOMMENDED_CPU_CORES = 4
-HIGH_PERFORMANCE_CPU_CORES = 8
-ENTERPRISE_CPU_CORES = 16
+MIN_CPU_CORES: Final = 2
+RECOMMENDED_CPU_CORES: Final = 4
+HIGH_PERFORMANCE_CPU_CORES: Final = 8
+ENTERPRISE_CPU_CORES: Final = 16
 
 # Memory thresholds (in GB)
-MINIMUM_MEMORY_GB = 2.0
-LOW_MEMORY_WARNING_GB = 4.0
-RECOMMENDED_MEMORY_GB = 8.0
-MEDIUM_MEMORY_THRESHOLD = 8.0
+MINIMUM_MEMORY_GB: Final = 2.0
+LOW_MEMORY_WARNING_GB: Final = 4.0
+RECOMMENDED_MEMORY_GB: Final = 8.0
+MEDIUM_MEMORY_THRESHOLD: Final = 8.0
 
 # Disk space thresholds (in GB)
-MINIMUM_DISK_SPACE_GB = 1.0
-RECOMMENDED_DISK_SPACE_GB = 5.0
-LARGE_DATASET_DISK_SPACE_GB = 10.0
+MINIMUM_DISK_SPACE_GB: Final = 1.0
+RECOMMENDED_DISK_SPACE_GB: Final = 5.0
+LARGE_DATASET_DISK_SPACE_GB: Final = 10.0
 
 # Configuration validation limits
-MAX_MEMORY_LIMIT_WARNING = 64
-MIN_STREAMING_BATCH_SIZE = 10
-MAX_CONCURRENT_DOWNLOADS_WARNING = 100
-MIN_CACHE_SIZE_WARNING = 0.1
-MIN_DISTANCE_CHUNK_SIZE = 100
-MAX_DISTANCE_CHUNK_SIZE = 100000
+MAX_MEMORY_LIMIT_WARNING: Final = 64
+MIN_STREAMING_BATCH_SIZE: Final = 10
+MAX_CONCURRENT_DOWNLOADS_WARNING: Final = 100
+MIN_CACHE_SIZE_WARNING: Final = 0.1
+MIN_DISTANCE_CHUNK_SIZE: Final = 100
+MAX_DISTANCE_CHUNK_SIZE: Final = 100000
 
 # UI display limits
-MAX_POI_NAME_DISPLAY_LENGTH = 30
-MAX_POI_DISPLAY_COUNT = 10
-POI_COUNT_TRUNCATION_THRESHOLD = 10
+MAX_POI_NAME_DISPLAY_LENGTH: Final = 30
+MAX_POI_DISPLAY_COUNT: Final = 10
+POI_COUNT_TRUNCATION_THRESHOLD: Final = 10
 
 # Scale and measurement constants
-SCALE_METER_TO_KM_THRESHOLD = 1
-SCALE_KM_DISPLAY_THRESHOLD = 10
+SCALE_METER_TO_KM_THRESHOLD: Final = 1
+SCALE_KM_DISPLAY_THRESHOLD: Final = 10
 
 # Classification limits
-MIN_CLASSIFICATION_CLASSES = 2
-MAX_CLASSIFICATION_CLASSES = 12
+MIN_CLASSIFICATION_CLASSES: Final = 2
+MAX_CLASSIFICATION_CLASSES: Final = 12
 
 
 # =============================================================================
@@ -95,18 +99,18 @@ MAX_CLASSIFICATION_CLASSES = 12
 # =============================================================================
 
 # Travel time constraints (minutes)
-MIN_TRAVEL_TIME = 1
-MAX_TRAVEL_TIME = 120
+MIN_TRAVEL_TIME: Final = 1
+MAX_TRAVEL_TIME: Final = 120
 
 # Timeout values (seconds)
-DEFAULT_API_TIMEOUT = 30
-LONG_API_TIMEOUT = 60
-SHORT_API_TIMEOUT = 10
+DEFAULT_API_TIMEOUT: Final = 30
+LONG_API_TIMEOUT: Final = 60
+SHORT_API_TIMEOUT: Final = 10
 
 # CPU and memory thresholds (percentages)
-HIGH_CPU_USAGE_THRESHOLD = 90
-HIGH_MEMORY_USAGE_THRESHOLD = 85
-MEMORY_WARNING_THRESHOLD = 75
+HIGH_CPU_USAGE_THRESHOLD: Final = 90
+HIGH_MEMORY_USAGE_THRESHOLD: Final = 85
+MEMORY_WARNING_THRESHOLD: Final = 75
 
 
 # =============================================================================
@@ -114,25 +118,25 @@ MEMORY_WARNING_THRESHOLD = 75
 # =============================================================================
 
 # Data size thresholds (MB)
-SMALL_DATASET_MB = 10.0
-MEDIUM_DATASET_MB = 100.0
-LARGE_DATASET_MB = 500.0
+SMALL_DATASET_MB: Final = 10.0
+MEDIUM_DATASET_MB: Final = 100.0
+LARGE_DATASET_MB: Final = 500.0
 
 # Record count thresholds
-SMALL_DATASET_RECORDS = 1000
-MEDIUM_DATASET_RECORDS = 10000
-LARGE_DATASET_RECORDS = 100000
+SMALL_DATASET_RECORDS: Final = 1000
+MEDIUM_DATASET_RECORDS: Final = 10000
+LARGE_DATASET_RECORDS: Final = 100000
 
 # Clustering and spatial analysis
-DEFAULT_CLUSTER_RADIUS_KM = 15.0
-MIN_CLUSTER_SIZE = 2
-DEFAULT_SPATIAL_BUFFER_KM = 5.0
+DEFAULT_CLUSTER_RADIUS_KM: Final = 15.0
+MIN_CLUSTER_SIZE: Final = 2
+DEFAULT_SPATIAL_BUFFER_KM: Final = 5.0
 
 # Distance thresholds (meters)
-CITY_SCALE_DISTANCE_M = 50000      # ~50km - city scale
-METRO_SCALE_DISTANCE_M = 100000    # ~100km - metro area scale
-REGIONAL_SCALE_DISTANCE_M = 200000 # ~200km - regional scale
-STATE_SCALE_DISTANCE_M = 400000    # ~400km - state scale
+CITY_SCALE_DISTANCE_M: Final = 50000      # ~50km - city scale
+METRO_SCALE_DISTANCE_M: Final = 100000    # ~100km - metro area scale
+REGIONAL_SCALE_DISTANCE_M: Final = 200000 # ~200km - regional scale
+STATE_SCALE_DISTANCE_M: Final = 400000    # ~400km - state scale
 
 
 # =============================================================================
@@ -140,18 +144,18 @@ STATE_SCALE_DISTANCE_M = 400000    # ~400km - state scale
 # =============================================================================
 
 # File processing
-MAX_BATCH_SIZE = 1000
-DEFAULT_CHUNK_SIZE = 5000
-LARGE_FILE_CHUNK_SIZE = 10000
+MAX_BATCH_SIZE: Final = 1000
+DEFAULT_CHUNK_SIZE: Final = 5000
+LARGE_FILE_CHUNK_SIZE: Final = 10000
 
 # Network and caching
-DEFAULT_CACHE_TTL_HOURS = 24
-MAX_RETRIES = 3
-DEFAULT_RATE_LIMIT_PER_SECOND = 1
+DEFAULT_CACHE_TTL_HOURS: Final = 24
+MAX_RETRIES: Final = 3
+DEFAULT_RATE_LIMIT_PER_SECOND: Final = 1
 
 # File size limits (bytes)
-MAX_UPLOAD_SIZE_MB = 100
-WARNING_FILE_SIZE_MB = 50
+MAX_UPLOAD_SIZE_MB: Final = 100
+WARNING_FILE_SIZE_MB: Final = 50
 
 
 # =============================================================================
@@ -159,16 +163,16 @@ WARNING_FILE_SIZE_MB = 50
 # =============================================================================
 
 # FIPS code lengths
-STATE_FIPS_LENGTH = 2
-COUNTY_FIPS_LENGTH = 3
-TRACT_LENGTH = 6
-BLOCK_GROUP_LENGTH = 1
-FULL_TRACT_GEOID_LENGTH = 11  # state + county + tract
-FULL_BLOCK_GROUP_GEOID_LENGTH = 12  # state + county + tract + block group
+STATE_FIPS_LENGTH: Final = 2
+COUNTY_FIPS_LENGTH: Final = 3
+TRACT_LENGTH: Final = 6
+BLOCK_GROUP_LENGTH: Final = 1
+FULL_TRACT_GEOID_LENGTH: Final = 11  # state + county + tract
+FULL_BLOCK_GROUP_GEOID_LENGTH: Final = 12  # state + county + tract + block group
 
 # Census data constraints
-MAX_VARIABLES_PER_REQUEST = 50
-MAX_GEOGRAPHIES_PER_REQUEST = 500
+MAX_VARIABLES_PER_REQUEST: Final = 50
+MAX_GEOGRAPHIES_PER_REQUEST: Final = 500
 
 
 # =============================================================================
@@ -176,17 +180,17 @@ MAX_GEOGRAPHIES_PER_REQUEST = 500
 # =============================================================================
 
 # Progress and display
-DEFAULT_PROGRESS_UPDATE_INTERVAL = 0.1  # seconds
-MIN_RECORDS_FOR_PROGRESS = 100
+DEFAULT_PROGRESS_UPDATE_INTERVAL: Final = 0.1  # seconds
+MIN_RECORDS_FOR_PROGRESS: Final = 100
 
 # Map visualization
-DEFAULT_MAP_DPI = 300
-DEFAULT_FIGURE_WIDTH = 12
-DEFAULT_FIGURE_HEIGHT = 8
+DEFAULT_MAP_DPI: Final = 300
+DEFAULT_FIGURE_WIDTH: Final = 12
+DEFAULT_FIGURE_HEIGHT: Final = 8
 
 # Color and styling
-DEFAULT_ALPHA = 0.7
-HIGHLIGHT_ALPHA = 0.9
+DEFAULT_ALPHA: Final = 0.7
+HIGHLIGHT_ALPHA: Final = 0.9
 
 
 # =============================================================================
@@ -194,15 +198,15 @@ HIGHLIGHT_ALPHA = 0.9
 # =============================================================================
 
 # String parsing
-COORDINATE_PAIR_PARTS = 2  # lat,lon format
+COORDINATE_PAIR_PARTS: Final = 2  # lat,lon format
 
 # Numeric validation tolerances
-COORDINATE_PRECISION_TOLERANCE = 1e-6
-PERCENTAGE_TOLERANCE = 0.01
+COORDINATE_PRECISION_TOLERANCE: Final = 1e-6
+PERCENTAGE_TOLERANCE: Final = 0.01
 
 # Default buffer sizes for various operations
-DEFAULT_GEOMETRY_BUFFER_M = 1000  # 1km default buffer
-INTERSECTION_BUFFER_M = 100       # Small buffer for intersection checks
+DEFAULT_GEOMETRY_BUFFER_M: Final = 1000  # 1km default buffer
+INTERSECTION_BUFFER_M: Final = 100       # Small buffer for intersection checks
 
 
 # =============================================================================
@@ -210,70 +214,69 @@ INTERSECTION_BUFFER_M = 100       # Small buffer for intersection checks
 # =============================================================================
 
 # Data Processing Constants
-CATEGORICAL_CONVERSION_THRESHOLD = 0.5  # Unique ratio threshold for converting to categorical
-DEFAULT_BATCH_SIZE = 1000  # Default batch size for processing
-PROGRESS_UPDATE_INTERVAL = 1000  # How often to update progress bars
-SMALL_DATASET_THRESHOLD = 50  # Threshold for small datasets
-MEDIUM_DATASET_THRESHOLD = 500  # Threshold for medium datasets
-LARGE_DATASET_THRESHOLD = 5000  # Threshold for large datasets
+CATEGORICAL_CONVERSION_THRESHOLD: Final = 0.5  # Unique ratio threshold for converting to categorical
+DEFAULT_BATCH_SIZE: Final = 1000  # Default batch size for processing
+PROGRESS_UPDATE_INTERVAL: Final = 1000  # How often to update progress bars
+SMALL_DATASET_THRESHOLD: Final = 50  # Threshold for small datasets
+MEDIUM_DATASET_THRESHOLD: Final = 500  # Threshold for medium datasets
+LARGE_DATASET_THRESHOLD: Final = 5000  # Threshold for large datasets
 
 # Travel and Distance Constants
-DEFAULT_TRAVEL_TIME_MINUTES = 30  # Default travel time for isochrones
-DEFAULT_SEARCH_RADIUS_KM = 50  # Default search radius in kilometers
-SHORT_DISTANCE_THRESHOLD_M = 500  # Short distance threshold in meters
+DEFAULT_TRAVEL_TIME_MINUTES: Final = 30  # Default travel time for isochrones
+DEFAULT_SEARCH_RADIUS_KM: Final = 50  # Default search radius in kilometers
+SHORT_DISTANCE_THRESHOLD_M: Final = 500  # Short distance threshold in meters
 
 # Area Constants
-SMALL_AREA_THRESHOLD_KM2 = 100  # Small area threshold in square kilometers
-MEDIUM_AREA_THRESHOLD_KM2 = 1000  # Medium area threshold in square kilometers
-SMALL_POLYGON_AREA_THRESHOLD_KM2 = 0.01  # Small polygon area threshold
+SMALL_AREA_THRESHOLD_KM2: Final = 100  # Small area threshold in square kilometers
+MEDIUM_AREA_THRESHOLD_KM2: Final = 1000  # Medium area threshold in square kilometers
+SMALL_POLYGON_AREA_THRESHOLD_KM2: Final = 0.01  # Small polygon area threshold
 
 # Rate Limiting Constants
-RATE_LIMIT_ADAPTATION_INTERVAL_S = 60  # Rate limit adaptation interval in seconds
-MIN_REQUESTS_BEFORE_RATE_INCREASE = 10  # Minimum requests before increasing rate
-ERROR_RATE_THRESHOLD = 0.1  # 10% error rate threshold
+RATE_LIMIT_ADAPTATION_INTERVAL_S: Final = 60  # Rate limit adaptation interval in seconds
+MIN_REQUESTS_BEFORE_RATE_INCREASE: Final = 10  # Minimum requests before increasing rate
+ERROR_RATE_THRESHOLD: Final = 0.1  # 10% error rate threshold
 
 # Cache Constants
-CACHE_EXPIRY_DAYS = 30  # Cache expiry in days
-RECENT_CACHE_THRESHOLD_DAYS = 7  # Recent cache threshold in days
-CACHE_SIZE_LIMIT_MB = 100  # Cache size limit in MB
-CACHE_REDUCTION_TARGET_RATIO = 0.8  # Target ratio when reducing cache
+CACHE_EXPIRY_DAYS: Final = 30  # Cache expiry in days
+RECENT_CACHE_THRESHOLD_DAYS: Final = 7  # Recent cache threshold in days
+CACHE_SIZE_LIMIT_MB: Final = 100  # Cache size limit in MB
+CACHE_REDUCTION_TARGET_RATIO: Final = 0.8  # Target ratio when reducing cache
 
 # Geocoding Constants
-WESTERN_US_LONGITUDE_THRESHOLD = -100  # Longitude threshold for western US states
+WESTERN_US_LONGITUDE_THRESHOLD: Final = -100  # Longitude threshold for western US states
 
 # Visualization Constants
-SCALE_TEXT_KM_THRESHOLD = 10  # Threshold for scale text formatting in km
-LEGEND_Y_POSITION = 0.2  # Legend position y-coordinate
-LEGEND_ITEM_LIMIT = 100  # Maximum number of legend items
-SUBPLOT_COUNT = 4  # Number of subplots in grid layouts
+SCALE_TEXT_KM_THRESHOLD: Final = 10  # Threshold for scale text formatting in km
+LEGEND_Y_POSITION: Final = 0.2  # Legend position y-coordinate
+LEGEND_ITEM_LIMIT: Final = 100  # Maximum number of legend items
+SUBPLOT_COUNT: Final = 4  # Number of subplots in grid layouts
 
 # POI Constants
-SMALL_POI_COUNT = 10  # Small POI count threshold
-LARGE_POI_COUNT = 100  # Large POI count threshold
+SMALL_POI_COUNT: Final = 10  # Small POI count threshold
+LARGE_POI_COUNT: Final = 100  # Large POI count threshold
 
 # ZCTA Constants
-SMALL_ZCTA_COUNT = 10  # Small ZCTA count threshold
-MEDIUM_ZCTA_COUNT = 50  # Medium ZCTA count threshold
-LARGE_ZCTA_BATCH_SIZE = 2000  # Batch size for large ZCTA queries
-SMALL_ZCTA_BATCH_SIZE = 500  # Batch size for small ZCTA queries
+SMALL_ZCTA_COUNT: Final = 10  # Small ZCTA count threshold
+MEDIUM_ZCTA_COUNT: Final = 50  # Medium ZCTA count threshold
+LARGE_ZCTA_BATCH_SIZE: Final = 2000  # Batch size for large ZCTA queries
+SMALL_ZCTA_BATCH_SIZE: Final = 500  # Batch size for small ZCTA queries
 
 # Network Processing Constants
-NETWORK_BUFFER_SCALE = 0.9  # Network buffer scale factor
-DISSOLVE_BUFFER_FACTOR = 0.99  # Dissolve buffer factor
-SIMPLIFICATION_TOLERANCE = 0.01  # Tolerance for geometry simplification
-AREA_SCALING_FACTOR = 0.5  # Area scaling factor for network processing
+NETWORK_BUFFER_SCALE: Final = 0.9  # Network buffer scale factor
+DISSOLVE_BUFFER_FACTOR: Final = 0.99  # Dissolve buffer factor
+SIMPLIFICATION_TOLERANCE: Final = 0.01  # Tolerance for geometry simplification
+AREA_SCALING_FACTOR: Final = 0.5  # Area scaling factor for network processing
 
 # Request Processing Constants
-LARGE_REQUEST_BATCH_SIZE = 10000  # Large request batch size
-CENSUS_REQUEST_BATCH_SIZE = 1000  # Census API request batch size
-SMALL_BATCH_SIZE = 100  # Small batch size for API requests
-TRANSFORM_BATCH_SIZE = 200  # Batch size for transform operations
+LARGE_REQUEST_BATCH_SIZE: Final = 10000  # Large request batch size
+CENSUS_REQUEST_BATCH_SIZE: Final = 1000  # Census API request batch size
+SMALL_BATCH_SIZE: Final = 100  # Small batch size for API requests
+TRANSFORM_BATCH_SIZE: Final = 200  # Batch size for transform operations
 
 # HTTP Status Codes (additional)
-HTTP_OK = 200
-HTTP_NOT_FOUND = 404
-HTTP_TOO_MANY_REQUESTS = 429  # Already defined above, but keeping for clarity
-HTTP_SERVER_ERROR = 500
+HTTP_OK: Final = 200
+HTTP_NOT_FOUND: Final = 404
+HTTP_SERVER_ERROR: Final = 500
 
 # =============================================================================
 # HELPER FUNCTIONS
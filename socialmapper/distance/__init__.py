@@ -11,7 +11,7 @@ from typing import Optional, Union
 
 import geopandas as gpd
 import numpy as np
-import pandas as pd
+import shapely
 from shapely.geometry import Point
 
 from socialmapper.progress import get_progress_bar
@@ -31,35 +31,37 @@ def preprocess_poi_data(pois):
         pois: List of POI dictionaries
 
     Returns:
-        List of POI dictionaries with coordinates at the top level
+        List of POI dictionaries with coordinates at the top level. POIs that
+        needed no changes are returned as-is rather than copied.
     """
     processed_pois = []
 
     for poi in pois:
-        poi_copy = dict(poi)  # Create a copy to avoid modifying original
+        lon = lat = None
 
         # Check if coordinates are in properties
         if "properties" in poi and "lon" not in poi:
             props = poi["properties"]
             if isinstance(props, dict):
                 if "lon" in props and "lat" in props:
-                    poi_copy["lon"] = props["lon"]
-                    poi_copy["lat"] = props["lat"]
+                    lon, lat = props["lon"], props["lat"]
                 elif "longitude" in props and "latitude" in props:
-                    poi_copy["lon"] = props["longitude"]
-                    poi_copy["lat"] = props["latitude"]
+                    lon, lat = props["longitude"], props["latitude"]
                 elif "lng" in props and "lat" in props:
-                    poi_copy["lon"] = props["lng"]
-                    poi_copy["lat"] = props["lat"]
+                    lon, lat = props["lng"], props["lat"]
 
         # Check if coordinates are in geometry
         elif "geometry" in poi and "lon" not in poi and isinstance(poi["geometry"], Point):
             geom = poi["geometry"]
             if hasattr(geom, "x") and hasattr(geom, "y"):
-                poi_copy["lon"] = geom.x
-                poi_copy["lat"] = geom.y
+                lon, lat = geom.x, geom.y
 
-        processed_pois.append(poi_copy)
+        if lon is None:
+            # Nothing to hoist; the original dict is passed through unchanged
+            processed_pois.append(poi)
+        else:
+            # Copy only when adding keys, to avoid modifying the original
+            processed_pois.append({**poi, "lon": lon, "lat": lat})
 
     return processed_pois
 
@@ -130,36 +132,36 @@ def add_travel_distances(
     if df.crs is None:
         df.set_crs("EPSG:4326", inplace=True)
 
-    # Calculate centroids efficiently
-    df_projected = df.to_crs("EPSG:5070")
-    centroids_projected = df_projected.geometry.centroid
-    centroids_gdf = gpd.GeoDataFrame(geometry=centroids_projected, crs="EPSG:5070")
-    centroids_wgs84 = centroids_gdf.to_crs("EPSG:4326")
-    df["centroid"] = centroids_wgs84.geometry
+    # Calculate centroids once in the engine CRS; the projected series feeds the
+    # distance engine directly and only the output column goes back to WGS84
+    centroids_projected = df.geometry.to_crs("EPSG:5070").centroid
+    df["centroid"] = centroids_projected.to_crs("EPSG:4326")
 
-    # Convert POIs to Points
-    poi_points = []
+    # Collect POI coordinates, then build all Points in one vectorized call
+    poi_coords = []
     for poi in pois:
         if "lon" in poi and "lat" in poi:
-            poi_points.append(Point(poi["lon"], poi["lat"]))
+            poi_coords.append((poi["lon"], poi["lat"]))
         elif "longitude" in poi and "latitude" in poi:
-            poi_points.append(Point(poi["longitude"], poi["latitude"]))
+            poi_coords.append((poi["longitude"], poi["latitude"]))
         elif "lng" in poi and "lat" in poi:
-            poi_points.append(Point(poi["lng"], poi["lat"]))
+            poi_coords.append((poi["lng"], poi["lat"]))
         elif "geometry" in poi and hasattr(poi["geometry"], "x") and hasattr(poi["geometry"], "y"):
-            poi_points.append(Point(poi["geometry"].x, poi["geometry"].y))
+            poi_coords.append((poi["geometry"].x, poi["geometry"].y))
         elif "coordinates" in poi:
             coords = poi["coordinates"]
             if isinstance(coords, list) and len(coords) >= 2:
-                poi_points.append(Point(coords[0], coords[1]))
+                poi_coords.append((coords[0], coords[1]))
         elif "properties" in poi and isinstance(poi["properties"], dict):
             props = poi["properties"]
             if "lon" in props and "lat" in props:
-                poi_points.append(Point(props["lon"], props["lat"]))
+                poi_coords.append((props["lon"], props["lat"]))
             elif "longitude" in props and "latitude" in props:
-                poi_points.append(Point(props["longitude"], props["latitude"]))
+                poi_coords.append((props["longitude"], props["latitude"]))
             elif "lng" in props and "lat" in props:
-                poi_points.append(Point(props["lng"], props["lat"]))
+                poi_coords.append((props["lng"], props["lat"]))
+
+    poi_points = shapely.points(np.asarray(poi_coords, dtype=float)).tolist() if poi_coords else []
 
     if not poi_points:
         df["travel_distance_km"] = float("nan")
@@ -168,14 +170,12 @@ def add_travel_distances(
 
     # Calculate distances using vectorized engine
     distances_km = _calculate_distances_vectorized(
-        poi_points, df["centroid"], n_jobs, chunk_size, verbose
+        poi_points, centroids_projected, n_jobs, chunk_size, verbose
     )
 
     # Add both km and miles
     df["travel_distance_km"] = distances_km
-    df["travel_distance_miles"] = [
-        d * 0.621371 if not pd.isna(d) else float("nan") for d in distances_km
-    ]
+    df["travel_distance_miles"] = np.asarray(distances_km, dtype=float) * 0.621371
 
     return df
 
@@ -38,13 +38,19 @@ class AddressCache:
             # Filter expired entries
             now = datetime.now()
             ttl_cutoff = now - timedelta(hours=self.config.cache_ttl_hours)
-            df = df[pd.to_datetime(df["timestamp"]) > ttl_cutoff]
-
-            # Convert to dict for fast lookup
-            for _, row in df.iterrows():
-                self._cache[row["cache_key"]] = {
-                    "result": json.loads(row["result_json"]),
-                    "timestamp": pd.to_datetime(row["timestamp"]),
+            timestamps = pd.to_datetime(df["timestamp"])
+            fresh = (timestamps > ttl_cutoff).to_numpy()
+
+            # Convert to dict for fast lookup, reading whole columns rather than rows
+            for cache_key, result_json, timestamp in zip(
+                df["cache_key"].to_numpy()[fresh],
+                df["result_json"].to_numpy()[fresh],
+                timestamps[fresh],
+                strict=True,
+            ):
+                self._cache[cache_key] = {
+                    "result": json.loads(result_json),
+                    "timestamp": timestamp,
                 }
 
             logger.info(f"Loaded {len(self._cache)} cached geocoding results")
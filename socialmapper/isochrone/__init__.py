@@ -39,6 +39,7 @@ from .clustering import (
     benchmark_clustering_performance,
     create_isochrone_from_poi_with_network,
     create_optimized_clusters,
+    get_degree_buffer,
 )
 from .concurrent import ConcurrentIsochroneProcessor, ProcessingStats, process_isochrones_concurrent
 from .travel_modes import TravelMode, get_travel_mode_config
@@ -100,12 +101,12 @@ def create_isochrone_from_poi(
 
     # Calculate bounding box for network download
     buffer_km = travel_time_limit * 1.5  # Adaptive buffer based on travel time
-    buffer_deg = buffer_km / 111.0
+    lat_buffer, lon_buffer = get_degree_buffer(buffer_km, latitude)
     bbox = (
-        latitude - buffer_deg,
-        longitude - buffer_deg,
-        latitude + buffer_deg,
-        longitude + buffer_deg,
+        latitude - lat_buffer,
+        longitude - lon_buffer,
+        latitude + lat_buffer,
+        longitude + lon_buffer,
     )
 
     # Download network with caching
@@ -175,13 +176,13 @@ def get_bounding_box(
     if not lons or not lats:
         raise ValueError("No valid coordinates in POIs")
 
-    # Convert buffer to approximate degrees (rough estimate)
-    buffer_deg = buffer_km / 111.0  # ~111km per degree at equator
+    # Convert buffer to degrees, scaling longitude for the most poleward latitude
+    lat_buffer, lon_buffer = get_degree_buffer(buffer_km, max(abs(min(lats)), abs(max(lats))))
 
-    min_lat = min(lats) - buffer_deg
-    min_lon = min(lons) - buffer_deg
-    max_lat = max(lats) + buffer_deg
-    max_lon = max(lons) + buffer_deg
+    min_lat = min(lats) - lat_buffer
+    min_lon = min(lons) - lon_buffer
+    max_lat = max(lats) + lat_buffer
+    max_lon = max(lons) + lon_buffer
 
     return (min_lat, min_lon, max_lat, max_lon)
 
@@ -233,6 +234,9 @@ def create_isochrones_from_poi_list(
 
     logger.info(f"Processing {len(pois)} POIs with modern isochrone generation")
 
+    # Clusters computed while auto-deciding, reused below instead of clustering twice
+    clusters = None
+
     # Auto-decide optimization strategies
     if use_clustering is None:
         # Use clustering for datasets with 5+ POIs
@@ -240,7 +244,12 @@ def create_isochrones_from_poi_list(
         if use_clustering:
             # Quick benchmark to verify clustering benefit
             benchmark = benchmark_clustering_performance(
-                pois, travel_time_limit, max_cluster_radius_km
+                pois, travel_time_limit, max_cluster_radius_km, min_cluster_size
+            )
+            clusters = create_optimized_clusters(
+                pois=pois,
+                travel_time_minutes=travel_time_limit,
+                poi_clusters=benchmark["clusters"],
             )
             efficiency_rating = benchmark["recommendations"]["efficiency_rating"]
             if efficiency_rating == "Fair":
@@ -268,18 +277,20 @@ def create_isochrones_from_poi_list(
             max_isochrone_workers=max_isochrone_workers,
             progress_callback=progress_callback,
             travel_mode=travel_mode,
+            clusters=clusters,
         )
 
     elif use_clustering:
         logger.info("Using intelligent clustering optimization")
 
         # Create optimized clusters
-        clusters = create_optimized_clusters(
-            pois=pois,
-            travel_time_minutes=travel_time_limit,
-            max_cluster_radius_km=max_cluster_radius_km,
-            min_cluster_size=min_cluster_size,
-        )
+        if clusters is None:
+            clusters = create_optimized_clusters(
+                pois=pois,
+                travel_time_minutes=travel_time_limit,
+                max_cluster_radius_km=max_cluster_radius_km,
+                min_cluster_size=min_cluster_size,
+            )
 
         logger.info(f"Created {len(clusters)} optimized clusters")
 
@@ -15,10 +15,15 @@ Key Features:
 
 import gzip
 import hashlib
+import os
 import pickle
 import sqlite3
+import tempfile
 import threading
 import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -61,24 +66,51 @@ class CacheStats:
 class ModernNetworkCache:
     """High-performance network caching with SQLite index and compression."""
 
-    def __init__(self, cache_dir: str = "cache/networks", max_cache_size_gb: float = 5.0):
+    def __init__(
+        self,
+        cache_dir: str = "cache/networks",
+        max_cache_size_gb: float = 5.0,
+        max_memory_networks: int = 2,
+    ):
         """Initialize the modern network cache.
 
         Args:
             cache_dir: Directory to store cache files
             max_cache_size_gb: Maximum cache size in gigabytes
+            max_memory_networks: Number of decompressed networks to keep in memory.
+                Each can take hundreds of megabytes, so the default is small;
+                0 disables the in-memory layer
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.max_cache_size = max_cache_size_gb * 1024**3
+        self.max_memory_networks = max_memory_networks
         self.db_path = self.cache_dir / "cache_index.db"
         self._lock = threading.Lock()
+        # LRU of decompressed graphs so repeated hits skip disk reads and unpickling
+        self._memory_cache: OrderedDict[str, nx.MultiDiGraph] = OrderedDict()
         self._stats = CacheStats(0, 0, 0, 0.0, 0.0, 0.0)
         self._init_database()
 
+    @contextmanager
+    def _get_connection(self):
+        """Get index database connection with proper cleanup."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            # With WAL (set in _init_database), NORMAL sync cannot corrupt the
+            # index and avoids an fsync on every commit
+            conn.execute("PRAGMA synchronous = NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
     def _init_database(self):
         """Initialize SQLite database for cache indexing."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
+            # WAL lets concurrent workers read the index while another writes;
+            # the mode is persistent, so it only needs setting once
+            conn.execute("PRAGMA journal_mode = WAL")
+
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS networks (
@@ -123,8 +155,9 @@ class ModernNetworkCache:
         # Round bbox to reduce cache fragmentation
         rounded_bbox = tuple(round(coord, 4) for coord in bbox)
         key_data = f"{rounded_bbox}_{network_type}_{travel_time_minutes}"
-        # Use full SHA256 hash for better security and uniqueness
-        return hashlib.sha256(key_data.encode()).hexdigest()
+        # Non-cryptographic use: a 128-bit BLAKE2b digest is ample for uniqueness
+        # and cheaper to compute than SHA-256
+        return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
 
     def _get_file_path(self, cache_key: str) -> Path:
         """Get file path for cache key."""
@@ -140,6 +173,68 @@ class ModernNetworkCache:
         pickled_data = gzip.decompress(compressed_data)
         return pickle.loads(pickled_data)
 
+    def _remember_network(self, cache_key: str, network: nx.MultiDiGraph) -> None:
+        """Add a network to the in-memory LRU, evicting the least recently used."""
+        if self.max_memory_networks <= 0:
+            return
+
+        with self._lock:
+            self._memory_cache[cache_key] = network
+            self._memory_cache.move_to_end(cache_key)
+            while len(self._memory_cache) > self.max_memory_networks:
+                self._memory_cache.popitem(last=False)
+
+    @staticmethod
+    def _is_valid_cache_file(file_path: Path, expected_size: int) -> bool:
+        """Cheaply check that a cache file is complete before decompressing it.
+
+        Compares the on-disk size with the size recorded at store time and checks
+        the gzip magic bytes, catching truncated or foreign files without reading
+        and unpickling the whole graph.
+        """
+        try:
+            if file_path.stat().st_size != expected_size:
+                return False
+            with file_path.open("rb") as f:
+                return f.read(2) == b"\x1f\x8b"
+        except OSError:
+            return False
+
+    def _discard_entry(self, cache_key: str, file_path: Path) -> None:
+        """Remove a cache entry's file, index row, and in-memory copy."""
+        file_path.unlink(missing_ok=True)
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM networks WHERE cache_key = ?", (cache_key,))
+            conn.commit()
+        with self._lock:
+            self._memory_cache.pop(cache_key, None)
+
+    def _load_network(
+        self, cache_key: str, file_path: Path, expected_size: int
+    ) -> nx.MultiDiGraph | None:
+        """Load a cached network, from memory if possible, otherwise from disk.
+
+        Returns None (and drops the entry) if the file is missing or incomplete.
+        """
+        with self._lock:
+            network = self._memory_cache.get(cache_key)
+            if network is not None:
+                self._memory_cache.move_to_end(cache_key)
+                return network
+
+        if not self._is_valid_cache_file(file_path, expected_size):
+            if file_path.exists():
+                logger.warning(f"Discarding incomplete cache file for {cache_key}")
+            self._discard_entry(cache_key, file_path)
+            return None
+
+        with file_path.open("rb") as f:
+            compressed_data = f.read()
+
+        network = self._decompress_network(compressed_data)
+        self._remember_network(cache_key, network)
+        return network
+
     def _calculate_bbox_overlap(
         self, bbox1: tuple[float, float, float, float], bbox2: tuple[float, float, float, float]
     ) -> float:
@@ -170,7 +265,7 @@ class ModernNetworkCache:
         min_overlap: float = 0.8,
     ) -> list[NetworkMetadata]:
         """Find cached networks that significantly overlap with requested bbox."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.execute(
                 """
                 SELECT * FROM networks
@@ -235,10 +330,10 @@ class ModernNetworkCache:
         cache_key = self._generate_cache_key(bbox, network_type, travel_time_minutes)
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_connection() as conn:
                 cursor = conn.execute(
                     """
-                    SELECT file_path, node_count, edge_count FROM networks
+                    SELECT file_path, node_count, edge_count, file_size FROM networks
                     WHERE cache_key = ?
                 """,
                     (cache_key,),
@@ -246,14 +341,9 @@ class ModernNetworkCache:
 
                 row = cursor.fetchone()
                 if row:
-                    file_path = Path(row[0])
-                    if file_path.exists():
-                        # Load and decompress network
-                        with file_path.open("rb") as f:
-                            compressed_data = f.read()
-
-                        network = self._decompress_network(compressed_data)
-
+                    # Load and decompress network
+                    network = self._load_network(cache_key, Path(row[0]), row[3])
+                    if network is not None:
                         # Update access statistics
                         conn.execute(
                             """
@@ -286,11 +376,8 @@ class ModernNetworkCache:
             best_match = max(overlapping, key=lambda x: x.node_count)
             try:
                 file_path = self._get_file_path(best_match.cache_key)
-                if file_path.exists():
-                    with file_path.open("rb") as f:
-                        compressed_data = f.read()
-
-                    network = self._decompress_network(compressed_data)
+                network = self._load_network(best_match.cache_key, file_path, best_match.file_size)
+                if network is not None:
 
                     retrieval_time = (time.time() - start_time) * 1000
                     with self._lock:
@@ -337,9 +424,9 @@ class ModernNetworkCache:
 
             # Compress and save network
             compressed_data = self._compress_network(network)
+            self._write_atomic(file_path, compressed_data)
 
-            with file_path.open("wb") as f:
-                f.write(compressed_data)
+            self._remember_network(cache_key, network)
 
             # Calculate compression ratio
             original_size = len(pickle.dumps(network, protocol=pickle.HIGHEST_PROTOCOL))
@@ -358,7 +445,7 @@ class ModernNetworkCache:
                 cluster_size=cluster_size,
             )
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_connection() as conn:
                 conn.execute(
                     """
                     INSERT OR REPLACE INTO networks
@@ -406,10 +493,38 @@ class ModernNetworkCache:
             logger.error(f"Error storing network in cache: {e}")
             return False
 
+    def _write_atomic(self, file_path: Path, data: bytes) -> None:
+        """Write data to a temporary file and rename it into place.
+
+        Readers never see a partially written cache file, even if the process
+        dies mid-write.
+        """
+        fd, temp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            temp_path.replace(file_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def _get_total_size(self) -> int:
+        """Get the total size of cached network files in bytes.
+
+        Uses the file sizes recorded in the index rather than scanning and
+        stat-ing every file in the cache directory.
+        """
+        with self._get_connection() as conn:
+            (total_size,) = conn.execute(
+                "SELECT COALESCE(SUM(file_size), 0) FROM networks"
+            ).fetchone()
+        return total_size
+
     def _cleanup_if_needed(self):
         """Clean up cache if it exceeds size limit."""
         try:
-            total_size = sum(f.stat().st_size for f in self.cache_dir.glob("*.pkl.gz"))
+            total_size = self._get_total_size()
 
             if total_size > self.max_cache_size:
                 logger.info(
@@ -417,7 +532,7 @@ class ModernNetworkCache:
                 )
 
                 # Get files sorted by last access time and size
-                with sqlite3.connect(self.db_path) as conn:
+                with self._get_connection() as conn:
                     cursor = conn.execute(
                         """
                         SELECT cache_key, file_path, file_size, last_accessed, access_count
@@ -435,9 +550,11 @@ class ModernNetworkCache:
 
                         cache_key, file_path, file_size = row[0], row[1], row[2]
 
-                        # Remove file and database entry
+                        # Remove file, database entry, and in-memory copy
                         Path(file_path).unlink(missing_ok=True)
                         conn.execute("DELETE FROM networks WHERE cache_key = ?", (cache_key,))
+                        with self._lock:
+                            self._memory_cache.pop(cache_key, None)
 
                         removed_size += file_size
 
@@ -451,7 +568,7 @@ class ModernNetworkCache:
     def get_cache_stats(self) -> CacheStats:
         """Get current cache statistics."""
         try:
-            total_size = sum(f.stat().st_size for f in self.cache_dir.glob("*.pkl.gz"))
+            total_size = self._get_total_size()
 
             with self._lock:
                 stats = CacheStats(
@@ -477,13 +594,14 @@ class ModernNetworkCache:
                 file_path.unlink()
 
             # Clear database
-            with sqlite3.connect(self.db_path) as conn:
+            with self._get_connection() as conn:
                 conn.execute("DELETE FROM networks")
                 conn.commit()
 
-            # Reset statistics
+            # Reset statistics and drop in-memory networks
             with self._lock:
                 self._stats = CacheStats(0, 0, 0, 0.0, 0.0, 0.0)
+                self._memory_cache.clear()
 
             logger.info("Cache cleared successfully")
 
@@ -495,6 +613,23 @@ class ModernNetworkCache:
 _global_cache = None
 _cache_lock = threading.Lock()
 
+# Per-request locks so concurrent misses for the same network download it once;
+# weak values let a lock go away once no thread is using it
+_download_locks: weakref.WeakValueDictionary[tuple, threading.Lock] = (
+    weakref.WeakValueDictionary()
+)
+_download_locks_guard = threading.Lock()
+
+
+def _get_download_lock(key: tuple) -> threading.Lock:
+    """Get the lock serializing downloads for one (bbox, network type, time) key."""
+    with _download_locks_guard:
+        lock = _download_locks.get(key)
+        if lock is None:
+            lock = threading.Lock()
+            _download_locks[key] = lock
+        return lock
+
 
 def get_global_cache() -> ModernNetworkCache:
     """Get or create global cache instance."""
@@ -544,12 +679,40 @@ def download_and_cache_network(
         default_speed = 50.0
         highway_speeds = get_highway_speeds(TravelMode.DRIVE)
 
-    # Try to get from cache first
-    network = cache.get_network(bbox, network_type, travel_time_minutes)
-    if network is not None:
-        return network
-
-    # Download new network
+    # Serialize lookups for the same request so concurrent misses download the
+    # network once; later threads find it in the cache
+    download_key = (
+        cache.cache_dir,
+        cache._generate_cache_key(bbox, network_type, travel_time_minutes),
+    )
+    with _get_download_lock(download_key):
+        # Try to get from cache first
+        network = cache.get_network(bbox, network_type, travel_time_minutes)
+        if network is not None:
+            return network
+
+        return _download_network(
+            bbox,
+            network_type,
+            travel_time_minutes,
+            cluster_size,
+            cache,
+            default_speed=default_speed,
+            highway_speeds=highway_speeds,
+        )
+
+
+def _download_network(
+    bbox: tuple[float, float, float, float],
+    network_type: str,
+    travel_time_minutes: int,
+    cluster_size: int,
+    cache: ModernNetworkCache,
+    *,
+    default_speed: float,
+    highway_speeds: dict[str, float],
+) -> nx.MultiDiGraph | None:
+    """Download a network from OSM, add travel times, and store it in the cache."""
     try:
         logger.info(f"Downloading network for bbox {bbox} with network_type={network_type}")
 
@@ -20,15 +20,35 @@ import geopandas as gpd
 import networkx as nx
 import numpy as np
 import osmnx as ox
-from shapely.geometry import Point
+import pyproj
+from shapely.geometry import MultiPoint
 from sklearn.cluster import DBSCAN
 
 # Setup logging
+from ..constants import KM_PER_DEGREE_AT_EQUATOR
 from ..ui.console import get_logger
 from .travel_modes import TravelMode, get_default_speed, get_highway_speeds, get_network_type
 
 logger = get_logger(__name__)
 
+# Per-thread cache of WGS84 -> network CRS transformers (pyproj transformers
+# are not safe to share between threads)
+_transformer_cache = threading.local()
+
+
+def _get_wgs84_transformer(network_crs: str) -> pyproj.Transformer:
+    """Get a cached transformer from EPSG:4326 to the given network CRS."""
+    transformers = getattr(_transformer_cache, "transformers", None)
+    if transformers is None:
+        transformers = _transformer_cache.transformers = {}
+
+    key = str(network_crs)
+    transformer = transformers.get(key)
+    if transformer is None:
+        transformer = pyproj.Transformer.from_crs("EPSG:4326", network_crs, always_xy=True)
+        transformers[key] = transformer
+    return transformer
+
 
 @dataclass
 class ClusterMetrics:
@@ -44,6 +64,26 @@ class ClusterMetrics:
     estimated_time_savings_percent: float
 
 
+def get_degree_buffer(buffer_km: float, latitude: float) -> tuple[float, float]:
+    """Convert a buffer distance to (latitude, longitude) degree offsets.
+
+    A degree of longitude shrinks with cos(latitude), so the longitude offset is
+    widened accordingly to cover the same ground distance as the latitude offset.
+
+    Args:
+        buffer_km: Buffer distance in kilometers
+        latitude: Latitude at which the buffer is applied (use the most poleward
+            latitude of a bounding box to stay conservative)
+
+    Returns:
+        Tuple of (lat_buffer_deg, lon_buffer_deg)
+    """
+    lat_buffer = buffer_km / KM_PER_DEGREE_AT_EQUATOR
+    # Clamp near the poles to keep the longitude buffer finite
+    cos_lat = max(np.cos(np.radians(latitude)), 0.01)
+    return lat_buffer, float(lat_buffer / cos_lat)
+
+
 class IntelligentPOIClusterer:
     """Advanced POI clustering using machine learning algorithms."""
 
@@ -73,8 +113,12 @@ class IntelligentPOIClusterer:
         if len(pois) <= 1:
             return [pois]
 
-        # Extract coordinates
-        coords = np.array([[poi["lat"], poi["lon"]] for poi in pois])
+        # Extract coordinates straight into one preallocated (n, 2) float array,
+        # converting to radians in place for the haversine metric
+        coords = np.empty((len(pois), 2), dtype=np.float64)
+        coords[:, 0] = np.fromiter((poi["lat"] for poi in pois), dtype=np.float64, count=len(pois))
+        coords[:, 1] = np.fromiter((poi["lon"] for poi in pois), dtype=np.float64, count=len(pois))
+        np.radians(coords, out=coords)
 
         # Adjust clustering radius based on travel time
         # Larger travel times allow for larger clusters
@@ -88,7 +132,7 @@ class IntelligentPOIClusterer:
 
         clustering = DBSCAN(
             eps=eps_radians, min_samples=self.min_cluster_size, metric="haversine"
-        ).fit(np.radians(coords))
+        ).fit(coords)
 
         # Group POIs by cluster
         clusters = {}
@@ -121,14 +165,16 @@ class IntelligentPOIClusterer:
 
     def get_cluster_metrics(self, pois: list[dict], clusters: list[list[dict]]) -> ClusterMetrics:
         """Calculate detailed metrics for clustering performance."""
-        cluster_sizes = [len(cluster) for cluster in clusters]
+        # Build the size array once and reduce it, rather than re-scanning a list per statistic
+        cluster_sizes = np.fromiter(map(len, clusters), dtype=np.int64, count=len(clusters))
+        has_clusters = cluster_sizes.size > 0
 
         return ClusterMetrics(
             total_pois=len(pois),
             num_clusters=len(clusters),
-            avg_cluster_size=np.mean(cluster_sizes) if cluster_sizes else 0,
-            max_cluster_size=max(cluster_sizes) if cluster_sizes else 0,
-            min_cluster_size=min(cluster_sizes) if cluster_sizes else 0,
+            avg_cluster_size=float(cluster_sizes.mean()) if has_clusters else 0,
+            max_cluster_size=int(cluster_sizes.max()) if has_clusters else 0,
+            min_cluster_size=int(cluster_sizes.min()) if has_clusters else 0,
             clustering_time_seconds=0,  # Set externally
             network_downloads_saved=len(pois) - len(clusters),
             estimated_time_savings_percent=(
@@ -164,13 +210,12 @@ class OptimizedPOICluster:
             return 0.0
 
         centroid_lat, centroid_lon = self.centroid
-        max_distance = 0.0
-
-        for poi in self.pois:
-            distance = self._haversine_distance(centroid_lat, centroid_lon, poi["lat"], poi["lon"])
-            max_distance = max(max_distance, distance)
+        lats = np.fromiter((poi["lat"] for poi in self.pois), dtype=np.float64, count=len(self.pois))
+        lons = np.fromiter((poi["lon"] for poi in self.pois), dtype=np.float64, count=len(self.pois))
 
-        return max_distance
+        # _haversine_distance is written with numpy ufuncs, so it evaluates all POIs at once
+        distances = self._haversine_distance(centroid_lat, centroid_lon, lats, lons)
+        return float(distances.max())
 
     def _calculate_bbox(self) -> tuple[float, float, float, float]:
         """Calculate bounding box (min_lat, min_lon, max_lat, max_lon)."""
@@ -183,8 +228,13 @@ class OptimizedPOICluster:
         return (min(lats), min(lons), max(lats), max(lons))
 
     @staticmethod
-    def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate haversine distance between two points in kilometers."""
+    def _haversine_distance(
+        lat1: float, lon1: float, lat2: float | np.ndarray, lon2: float | np.ndarray
+    ) -> float | np.ndarray:
+        """Calculate haversine distance between two points in kilometers.
+
+        ``lat2``/``lon2`` may be arrays, in which case an array of distances is returned.
+        """
         earth_radius_km = 6371.0  # Earth radius in kilometers
 
         lat1_rad = np.radians(lat1)
@@ -210,14 +260,16 @@ class OptimizedPOICluster:
         # Larger clusters and longer travel times need bigger buffers
         adaptive_buffer = buffer_km + (travel_time_minutes / 15.0) + (len(self.pois) / 10.0)
 
-        # Convert buffer to approximate degrees
-        buffer_deg = adaptive_buffer / 111.0
+        # Convert buffer to degrees, scaling longitude for latitude
+        lat_buffer, lon_buffer = get_degree_buffer(
+            adaptive_buffer, max(abs(min_lat), abs(max_lat))
+        )
 
         return (
-            min_lat - buffer_deg,
-            min_lon - buffer_deg,
-            max_lat + buffer_deg,
-            max_lon + buffer_deg,
+            min_lat - lat_buffer,
+            min_lon - lon_buffer,
+            max_lat + lat_buffer,
+            max_lon + lon_buffer,
         )
 
     def __len__(self):
@@ -234,6 +286,7 @@ def create_optimized_clusters(
     travel_time_minutes: int = 15,
     max_cluster_radius_km: float = 15.0,
     min_cluster_size: int = 2,
+    poi_clusters: list[list[dict[str, Any]]] | None = None,
 ) -> list[OptimizedPOICluster]:
     """Create optimized POI clusters using intelligent spatial algorithms.
 
@@ -242,6 +295,8 @@ def create_optimized_clusters(
         travel_time_minutes: Travel time limit for isochrone generation
         max_cluster_radius_km: Maximum clustering radius in kilometers
         min_cluster_size: Minimum POIs per cluster
+        poi_clusters: Optional precomputed clustering of ``pois`` (e.g. from
+            ``benchmark_clustering_performance``); skips running DBSCAN again
 
     Returns:
         List of OptimizedPOICluster objects
@@ -249,12 +304,13 @@ def create_optimized_clusters(
     if not pois:
         return []
 
-    # Use intelligent clusterer
-    clusterer = IntelligentPOIClusterer(
-        max_cluster_radius_km=max_cluster_radius_km, min_cluster_size=min_cluster_size
-    )
+    if poi_clusters is None:
+        # Use intelligent clusterer
+        clusterer = IntelligentPOIClusterer(
+            max_cluster_radius_km=max_cluster_radius_km, min_cluster_size=min_cluster_size
+        )
 
-    poi_clusters = clusterer.cluster_pois(pois, travel_time_minutes)
+        poi_clusters = clusterer.cluster_pois(pois, travel_time_minutes)
 
     # Convert to OptimizedPOICluster objects
     optimized_clusters = []
@@ -376,10 +432,9 @@ def create_isochrone_from_poi_with_network(
         poi_point = validated_coord.to_point()
 
         # Use PyProj transformer directly to avoid single-point GeoSeries transformation
-        # This bypasses the problematic GeoPandas to_crs() call that triggers the NumPy warning
-        import pyproj
-
-        transformer = pyproj.Transformer.from_crs("EPSG:4326", network_crs, always_xy=True)
+        # This bypasses the problematic GeoPandas to_crs() call that triggers the NumPy warning.
+        # The transformer is built once per CRS rather than once per POI.
+        transformer = _get_wgs84_transformer(network_crs)
 
         # Transform the single point directly using PyProj (avoiding NumPy array operations)
         poi_x_proj, poi_y_proj = transformer.transform(poi_point.x, poi_point.y)
@@ -387,32 +442,32 @@ def create_isochrone_from_poi_with_network(
         # Find nearest node using the transformed coordinates
         poi_node = ox.nearest_nodes(network, X=poi_x_proj, Y=poi_y_proj)
 
-        # Generate subgraph based on travel time
-        subgraph = nx.ego_graph(
+        # Travel times to every node within the limit; reading coordinates straight
+        # from the network avoids materialising an ego subgraph per POI
+        reachable = nx.single_source_dijkstra_path_length(
             network,
             poi_node,
-            radius=travel_time_minutes * 60,  # Convert to seconds
-            distance="travel_time",
+            cutoff=travel_time_minutes * 60,  # Convert to seconds
+            weight="travel_time",
         )
 
-        if len(subgraph.nodes) == 0:
+        if len(reachable) == 0:
             logger.warning(f"No reachable nodes for POI {poi.get('id', 'unknown')}")
             return None
 
         # Create isochrone polygon from reachable nodes
-        node_points = [Point((data["x"], data["y"])) for node, data in subgraph.nodes(data=True)]
+        node_data = network.nodes
+        node_coords = np.array([(node_data[n]["x"], node_data[n]["y"]) for n in reachable])
 
-        if len(node_points) < 3:
+        if len(node_coords) < 3:
             logger.warning(
-                f"Insufficient nodes ({len(node_points)}) to create polygon for POI {poi.get('id', 'unknown')}"
+                f"Insufficient nodes ({len(node_coords)}) to create polygon for POI {poi.get('id', 'unknown')}"
             )
             return None
 
-        # Create GeoDataFrame from node points
-        nodes_gdf = gpd.GeoDataFrame(geometry=node_points, crs=network_crs)
-
-        # Use convex hull to create the isochrone polygon
-        isochrone = nodes_gdf.union_all().convex_hull
+        # Use convex hull to create the isochrone polygon; a single MultiPoint built
+        # from the coordinate array avoids a per-node Point and a GEOS union
+        isochrone = MultiPoint(node_coords).convex_hull
 
         # Create result GeoDataFrame
         isochrone_gdf = gpd.GeoDataFrame(geometry=[isochrone], crs=network_crs).to_crs("EPSG:4326")
@@ -433,7 +488,10 @@ def create_isochrone_from_poi_with_network(
 
 
 def benchmark_clustering_performance(
-    pois: list[dict[str, Any]], travel_time_minutes: int = 15, max_cluster_radius_km: float = 15.0
+    pois: list[dict[str, Any]],
+    travel_time_minutes: int = 15,
+    max_cluster_radius_km: float = 15.0,
+    min_cluster_size: int = 2,
 ) -> dict[str, Any]:
     """Benchmark clustering performance and provide optimization recommendations.
 
@@ -441,15 +499,17 @@ def benchmark_clustering_performance(
         pois: List of POI dictionaries
         travel_time_minutes: Travel time limit
         max_cluster_radius_km: Maximum clustering radius
+        min_cluster_size: Minimum POIs per cluster
 
     Returns:
-        Dictionary with performance metrics and recommendations
+        Dictionary with performance metrics, recommendations, and the computed
+        ``clusters`` so callers can reuse them instead of clustering again
     """
     start_time = time.time()
 
     # Test different clustering parameters
     clusterer = IntelligentPOIClusterer(
-        max_cluster_radius_km=max_cluster_radius_km, min_cluster_size=2
+        max_cluster_radius_km=max_cluster_radius_km, min_cluster_size=min_cluster_size
     )
 
     clusters = clusterer.cluster_pois(pois, travel_time_minutes)
@@ -467,6 +527,7 @@ def benchmark_clustering_performance(
     ) * 30  # 30s per download estimate
 
     return {
+        "clusters": clusters,
         "metrics": metrics,
         "performance": {
             "original_downloads": total_downloads_original,
@@ -207,6 +207,7 @@ class ConcurrentIsochroneProcessor:
         min_cluster_size: int = 2,
         progress_callback: Callable | None = None,
         travel_mode: TravelMode = TravelMode.DRIVE,
+        clusters: list[OptimizedPOICluster] | None = None,
     ) -> list[gpd.GeoDataFrame]:
         """Process POIs concurrently to generate isochrones.
 
@@ -217,6 +218,7 @@ class ConcurrentIsochroneProcessor:
             min_cluster_size: Minimum POIs per cluster
             progress_callback: Optional callback for progress updates
             travel_mode: Mode of travel (walk, bike, drive)
+            clusters: Optional precomputed clusters of ``pois``; skips clustering
 
         Returns:
             List of isochrone GeoDataFrames
@@ -229,13 +231,14 @@ class ConcurrentIsochroneProcessor:
         logger.info(f"Starting concurrent processing of {len(pois)} POIs")
 
         # Step 1: Create optimized clusters
-        logger.info("Creating optimized POI clusters...")
-        clusters = create_optimized_clusters(
-            pois=pois,
-            travel_time_minutes=travel_time_minutes,
-            max_cluster_radius_km=max_cluster_radius_km,
-            min_cluster_size=min_cluster_size,
-        )
+        if clusters is None:
+            logger.info("Creating optimized POI clusters...")
+            clusters = create_optimized_clusters(
+                pois=pois,
+                travel_time_minutes=travel_time_minutes,
+                max_cluster_radius_km=max_cluster_radius_km,
+                min_cluster_size=min_cluster_size,
+            )
 
         self._stats.total_clusters = len(clusters)
         self._stats.avg_cluster_size = len(pois) / len(clusters) if clusters else 0
@@ -399,6 +402,7 @@ def process_isochrones_concurrent(
     cache: ModernNetworkCache | None = None,
     progress_callback: Callable | None = None,
     travel_mode: TravelMode = TravelMode.DRIVE,
+    clusters: list[OptimizedPOICluster] | None = None,
 ) -> list[gpd.GeoDataFrame]:
     """Process isochrones concurrently with optimized settings.
 
@@ -412,6 +416,7 @@ def process_isochrones_concurrent(
         cache: Network cache instance
         progress_callback: Optional progress callback
         travel_mode: Mode of travel (walk, bike, drive)
+        clusters: Optional precomputed clusters of ``pois``
 
     Returns:
         List of isochrone GeoDataFrames
@@ -429,4 +434,5 @@ def process_isochrones_concurrent(
         min_cluster_size=min_cluster_size,
         progress_callback=progress_callback,
         travel_mode=travel_mode,
+        clusters=clusters,
     )
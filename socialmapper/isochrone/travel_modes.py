@@ -69,6 +69,61 @@ TRAVEL_MODE_CONFIGS: dict[TravelMode, TravelModeConfig] = {
 }
 
 
+# Highway-type-specific speeds (km/h) per travel mode, used by OSMnx routing
+HIGHWAY_SPEEDS: dict[TravelMode, dict[str, float]] = {
+    # Walking speeds for different path types
+    TravelMode.WALK: {
+        "footway": 5.0,  # Dedicated pedestrian paths
+        "path": 4.5,  # General paths (may be rougher)
+        "pedestrian": 5.0,  # Pedestrian areas
+        "steps": 1.5,  # Stairs are very slow
+        "sidewalk": 5.0,  # Sidewalks
+        "residential": 4.8,  # Residential streets (may lack sidewalks)
+        "living_street": 4.5,  # Shared spaces, need caution
+        "service": 4.5,  # Service roads
+        "primary": 4.5,  # Busy roads may slow walking
+        "secondary": 4.5,  # Busy roads
+        "tertiary": 4.8,  # Less busy roads
+        "trunk": 4.0,  # Very busy roads, often no sidewalk
+        "motorway": 3.0,  # Highways (rarely walkable)
+    },
+    # Cycling speeds for different road types
+    TravelMode.BIKE: {
+        "cycleway": 18.0,  # Dedicated bike lanes
+        "path": 12.0,  # Shared paths
+        "footway": 8.0,  # Shared with pedestrians (slow)
+        "pedestrian": 8.0,  # Pedestrian areas (slow cycling)
+        "residential": 15.0,  # Residential streets
+        "living_street": 10.0,  # Shared spaces
+        "service": 12.0,  # Service roads
+        "tertiary": 16.0,  # Light traffic
+        "secondary": 18.0,  # Moderate traffic
+        "primary": 20.0,  # Good roads, higher speeds
+        "trunk": 15.0,  # May be dangerous/restricted
+        "motorway": 10.0,  # Highways (if allowed at all)
+    },
+    # Driving speeds based on typical speed limits
+    # These align with common speed limits in many countries
+    TravelMode.DRIVE: {
+        "motorway": 110.0,  # Highways/freeways
+        "motorway_link": 70.0,  # Highway ramps
+        "trunk": 90.0,  # Major roads
+        "trunk_link": 50.0,  # Major road ramps
+        "primary": 65.0,  # Primary roads
+        "primary_link": 40.0,  # Primary road connectors
+        "secondary": 55.0,  # Secondary roads
+        "secondary_link": 35.0,  # Secondary road connectors
+        "tertiary": 45.0,  # Tertiary roads
+        "tertiary_link": 30.0,  # Tertiary road connectors
+        "residential": 30.0,  # Residential streets
+        "living_street": 20.0,  # Shared residential areas
+        "service": 25.0,  # Service roads
+        "unclassified": 40.0,  # Unclassified roads
+        "road": 40.0,  # Unknown road types
+    },
+}
+
+
 def get_travel_mode_config(mode: TravelMode) -> TravelModeConfig:
     """Get configuration for a travel mode."""
     return TRAVEL_MODE_CONFIGS[mode]
@@ -94,58 +149,8 @@ def get_highway_speeds(mode: TravelMode) -> dict[str, float]:
         mode: Travel mode (walk, bike, or drive)
 
     Returns:
-        Dictionary mapping highway types to speeds in km/h
+        Dictionary mapping highway types to speeds in km/h. The mapping is
+        shared module state; copy it before modifying.
     """
-    if mode == TravelMode.WALK:
-        # Walking speeds for different path types
-        return {
-            "footway": 5.0,  # Dedicated pedestrian paths
-            "path": 4.5,  # General paths (may be rougher)
-            "pedestrian": 5.0,  # Pedestrian areas
-            "steps": 1.5,  # Stairs are very slow
-            "sidewalk": 5.0,  # Sidewalks
-            "residential": 4.8,  # Residential streets (may lack sidewalks)
-            "living_street": 4.5,  # Shared spaces, need caution
-            "service": 4.5,  # Service roads
-            "primary": 4.5,  # Busy roads may slow walking
-            "secondary": 4.5,  # Busy roads
-            "tertiary": 4.8,  # Less busy roads
-            "trunk": 4.0,  # Very busy roads, often no sidewalk
-            "motorway": 3.0,  # Highways (rarely walkable)
-        }
-    elif mode == TravelMode.BIKE:
-        # Cycling speeds for different road types
-        return {
-            "cycleway": 18.0,  # Dedicated bike lanes
-            "path": 12.0,  # Shared paths
-            "footway": 8.0,  # Shared with pedestrians (slow)
-            "pedestrian": 8.0,  # Pedestrian areas (slow cycling)
-            "residential": 15.0,  # Residential streets
-            "living_street": 10.0,  # Shared spaces
-            "service": 12.0,  # Service roads
-            "tertiary": 16.0,  # Light traffic
-            "secondary": 18.0,  # Moderate traffic
-            "primary": 20.0,  # Good roads, higher speeds
-            "trunk": 15.0,  # May be dangerous/restricted
-            "motorway": 10.0,  # Highways (if allowed at all)
-        }
-    else:  # DRIVE
-        # Driving speeds based on typical speed limits
-        # These align with common speed limits in many countries
-        return {
-            "motorway": 110.0,  # Highways/freeways
-            "motorway_link": 70.0,  # Highway ramps
-            "trunk": 90.0,  # Major roads
-            "trunk_link": 50.0,  # Major road ramps
-            "primary": 65.0,  # Primary roads
-            "primary_link": 40.0,  # Primary road connectors
-            "secondary": 55.0,  # Secondary roads
-            "secondary_link": 35.0,  # Secondary road connectors
-            "tertiary": 45.0,  # Tertiary roads
-            "tertiary_link": 30.0,  # Tertiary road connectors
-            "residential": 30.0,  # Residential streets
-            "living_street": 20.0,  # Shared residential areas
-            "service": 25.0,  # Service roads
-            "unclassified": 40.0,  # Unclassified roads
-            "road": 40.0,  # Unknown road types
-        }
+    # Unknown modes fall back to driving speeds, as before
+    return HIGHWAY_SPEEDS.get(mode, HIGHWAY_SPEEDS[TravelMode.DRIVE])
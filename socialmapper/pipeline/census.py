@@ -7,6 +7,7 @@ import logging
 from typing import Any
 
 import geopandas as gpd
+import numpy as np
 
 from ..census import get_census_system
 from ..progress import get_progress_bar
@@ -36,17 +37,20 @@ def integrate_census_data(
     """
     from ..distance import add_travel_distances
 
-    print("\n=== Integrating Census Data ===")
+    logger.info("=== Integrating Census Data ===")
 
     # Get census system
     census_system = get_census_system()
 
-    # Process variables - normalize them to census codes
-    census_codes = []
+    # Process variables - normalize each distinct variable to its census code(s)
+    # once; the same mapping feeds both the codes and the readable names
+    variable_service = census_system._variable_service
+    normalized_variables = {
+        var: variable_service.normalize_variable(var) for var in dict.fromkeys(census_variables)
+    }
 
-    for var in census_variables:
-        # Normalize the variable to its census code(s)
-        normalized = census_system._variable_service.normalize_variable(var)
+    census_codes = []
+    for normalized in normalized_variables.values():
         if isinstance(normalized, list):
             # Calculated variable - add all component codes
             census_codes.extend(normalized)
@@ -57,18 +61,18 @@ def integrate_census_data(
     # Remove duplicates while preserving order
     census_codes = list(dict.fromkeys(census_codes))
 
-    # Display human-readable names for requested census variables
-    readable_names = []
-    for var in census_variables:
-        normalized = census_system._variable_service.normalize_variable(var)
-        if isinstance(normalized, list):
-            # It's a calculated variable
-            readable_names.append(census_system._variable_service.get_readable_variable(var))
-        else:
-            readable_names.append(census_system._variable_service.get_readable_variable(normalized))
-
-    print(f"Requesting census data for: {', '.join(readable_names)}")
-    print(f"Geographic level: {geographic_level}")
+    # Display human-readable names for requested census variables; the names are
+    # only looked up when the message will actually be emitted
+    if logger.isEnabledFor(logging.INFO):
+        readable_names = [
+            # Calculated variables are named by the variable itself, simple ones by their code
+            variable_service.get_readable_variable(
+                var if isinstance(normalized, list) else normalized
+            )
+            for var, normalized in normalized_variables.items()
+        ]
+        logger.info("Requesting census data for: %s", ", ".join(readable_names))
+    logger.info("Geographic level: %s", geographic_level)
 
     # Get geographic units based on level
     if geographic_level == "zcta":
@@ -84,20 +88,20 @@ def integrate_census_data(
             pbar.update(1)
 
             # Filter to intersecting ZCTAs
-            isochrone_union = isochrone_gdf.geometry.union_all()
-            intersecting_mask = geographic_units_gdf.geometry.intersects(isochrone_union)
-            geographic_units_gdf = geographic_units_gdf[intersecting_mask]
+            geographic_units_gdf = _filter_intersecting(geographic_units_gdf, isochrone_gdf)
 
         if geographic_units_gdf is None or geographic_units_gdf.empty:
             raise ValueError("No ZIP Code Tabulation Areas found intersecting with isochrones.")
 
-        print(f"Found {len(geographic_units_gdf)} intersecting ZIP Code Tabulation Areas")
+        logger.info(
+            "Found %d intersecting ZIP Code Tabulation Areas", len(geographic_units_gdf)
+        )
     else:
         # Try spatial query first, fall back to county-based query if it fails
         try:
             from ..census.services.spatial_block_group_service import SpatialBlockGroupService
 
-            print("🔄 Using spatial query to fetch block groups intersecting isochrones")
+            logger.info("Using spatial query to fetch block groups intersecting isochrones")
             spatial_service = SpatialBlockGroupService()
 
             with get_progress_bar(
@@ -109,18 +113,18 @@ def integrate_census_data(
             if geographic_units_gdf is None or geographic_units_gdf.empty:
                 raise ValueError("No census block groups found intersecting with isochrones.")
 
-            print(f"Found {len(geographic_units_gdf)} intersecting census block groups")
+            logger.info("Found %d intersecting census block groups", len(geographic_units_gdf))
 
         except ValueError as e:
             if "Census TIGER API" in str(e):
                 # Fall back to county-based approach
-                print("⚠️ Spatial query failed, falling back to county-based approach")
+                logger.warning("Spatial query failed, falling back to county-based approach")
 
                 # Get counties from POI locations
                 counties = census_system.get_counties_from_pois(poi_data["pois"], include_neighbors=True)
 
                 if not counties:
-                    print("⚠️ Could not determine counties from POI locations")
+                    logger.warning("Could not determine counties from POI locations")
                     raise ValueError("Failed to determine counties for census data. This may be due to geocoding service issues.")
 
                 with get_progress_bar(
@@ -133,12 +137,10 @@ def integrate_census_data(
                     raise ValueError("No census block groups found.")
 
                 # Filter to only those intersecting isochrones
-                print("Filtering block groups to those intersecting isochrones...")
-                isochrone_union = isochrone_gdf.geometry.union_all()
-                intersecting_mask = geographic_units_gdf.geometry.intersects(isochrone_union)
-                geographic_units_gdf = geographic_units_gdf[intersecting_mask]
+                logger.info("Filtering block groups to those intersecting isochrones...")
+                geographic_units_gdf = _filter_intersecting(geographic_units_gdf, isochrone_gdf)
 
-                print(f"Found {len(geographic_units_gdf)} intersecting census block groups")
+                logger.info("Found %d intersecting census block groups", len(geographic_units_gdf))
             else:
                 raise
 
@@ -161,7 +163,9 @@ def integrate_census_data(
         raise
 
     units_label = "ZIP Code Tabulation Areas" if geographic_level == "zcta" else "block groups"
-    print(f"Calculated travel distances for {len(units_with_distances)} {units_label}")
+    logger.info(
+        "Calculated travel distances for %d %s", len(units_with_distances), units_label
+    )
 
     # Fetch census data
     try:
@@ -182,19 +186,17 @@ def integrate_census_data(
                 )
                 pbar.update(len(geoids) // 2)
 
-                # Merge census data with geographic units
-                census_data_gdf = units_with_distances.copy()
+                # Merge census data into the geographic units; add_travel_distances
+                # already returned a frame of its own, so it is filled in place
+                census_data_gdf = units_with_distances
 
-                # Add census variables to the GeoDataFrame
-                for _, row in census_data.iterrows():
-                    geoid = row["GEOID"]
-                    var_code = row["variable_code"]
-                    value = row["value"]
+                # Group the long-format rows by variable, then add each variable as a column
+                values_by_variable = {
+                    var_code: dict(zip(group["GEOID"], group["value"], strict=True))
+                    for var_code, group in census_data.groupby("variable_code", sort=False)
+                }
 
-                    # Find matching geographic unit and add the variable
-                    mask = census_data_gdf["GEOID"] == geoid
-                    if mask.any():
-                        census_data_gdf.loc[mask, var_code] = value
+                _merge_census_values(census_data_gdf, values_by_variable)
 
                 pbar.update(len(geoids) // 2)
             else:
@@ -202,19 +204,18 @@ def integrate_census_data(
                 census_data_points = census_system.get_census_data(census_codes, geoids, 2023)
                 pbar.update(len(geoids) // 2)
 
-                # Merge census data with geographic units
-                census_data_gdf = units_with_distances.copy()
+                # Merge census data into the geographic units; add_travel_distances
+                # already returned a frame of its own, so it is filled in place
+                census_data_gdf = units_with_distances
 
-                # Add census variables to the GeoDataFrame
+                # Group values by variable, then add each variable as a column
+                values_by_variable: dict[str, dict[str, Any]] = {}
                 for data_point in census_data_points:
-                    geoid = data_point.geoid
-                    var_code = data_point.variable.code
-                    value = data_point.value
+                    values_by_variable.setdefault(data_point.variable.code, {})[
+                        data_point.geoid
+                    ] = data_point.value
 
-                    # Find matching geographic unit and add the variable
-                    mask = census_data_gdf["GEOID"] == geoid
-                    if mask.any():
-                        census_data_gdf.loc[mask, var_code] = value
+                _merge_census_values(census_data_gdf, values_by_variable)
 
                 pbar.update(len(geoids) // 2)
         except Exception as e:
@@ -238,6 +239,41 @@ def integrate_census_data(
     variables_for_viz = [var for var in census_codes if var != "NAME"]
     census_data_gdf.attrs["variables_for_visualization"] = variables_for_viz
 
-    print(f"Retrieved census data for {len(census_data_gdf)} {units_label}")
+    logger.info("Retrieved census data for %d %s", len(census_data_gdf), units_label)
 
     return geographic_units_gdf, census_data_gdf, census_codes
+
+
+def _filter_intersecting(
+    units_gdf: gpd.GeoDataFrame, isochrone_gdf: gpd.GeoDataFrame
+) -> gpd.GeoDataFrame:
+    """Keep only the geographic units that intersect at least one isochrone.
+
+    Queries the units' spatial index with every isochrone in one bulk call
+    rather than unioning the isochrones and testing each unit against the union.
+
+    Args:
+        units_gdf: GeoDataFrame of geographic units
+        isochrone_gdf: GeoDataFrame of isochrones in the same CRS
+
+    Returns:
+        The intersecting units, in their original order
+    """
+    _, unit_idx = units_gdf.sindex.query(isochrone_gdf.geometry, predicate="intersects")
+    return units_gdf.iloc[np.unique(unit_idx)]
+
+
+def _merge_census_values(
+    census_data_gdf: gpd.GeoDataFrame, values_by_variable: dict[str, dict[str, Any]]
+) -> None:
+    """Add census values to a GeoDataFrame in place, one column per variable.
+
+    Args:
+        census_data_gdf: GeoDataFrame with a GEOID column
+        values_by_variable: Mapping of variable code to a {GEOID: value} mapping
+    """
+    geoids = census_data_gdf["GEOID"]
+    for var_code, values in values_by_variable.items():
+        # Only create columns for variables that matched at least one unit
+        if geoids.isin(values.keys()).any():
+            census_data_gdf[var_code] = geoids.map(values)
@@ -6,29 +6,8 @@ and initialization of tracking systems.
 
 from pathlib import Path
 
-from ..util import PathSecurityError, sanitize_path
 from ..util.invalid_data_tracker import reset_global_tracker
-
-
-def setup_directory(output_dir: str = "output") -> str:
-    """Create a single output directory.
-
-    Args:
-        output_dir: Path to the output directory
-
-    Returns:
-        The output directory path
-
-    Raises:
-        PathSecurityError: If the path is invalid or unsafe
-    """
-    try:
-        # Sanitize the output directory path
-        safe_output_dir = sanitize_path(output_dir, allow_absolute=True)
-        safe_output_dir.mkdir(parents=True, exist_ok=True)
-        return str(safe_output_dir)
-    except PathSecurityError as e:
-        raise PathSecurityError(f"Invalid output directory: {e}") from e
+from .helpers import setup_directory
 
 
 def setup_pipeline_environment(
@@ -45,29 +24,23 @@ def setup_pipeline_environment(
     Returns:
         Dictionary of created directory paths
     """
-    # Create base output directory
+    # Create base output directory (validated and created once, with parents)
     setup_directory(output_dir)
 
     directories = {"base": output_dir}
 
-    # Create subdirectories only for enabled outputs
-    if export_csv:
-        # Create csv subdirectory directly
-        csv_path = Path(output_dir) / "csv"
-        csv_path.mkdir(exist_ok=True)
-        directories["csv"] = str(csv_path)
-
-    if export_isochrones:
-        # Create isochrones subdirectory directly
-        isochrones_path = Path(output_dir) / "isochrones"
-        isochrones_path.mkdir(exist_ok=True)
-        directories["isochrones"] = str(isochrones_path)
-
-    if create_maps:
-        # Create maps subdirectory directly
-        maps_path = Path(output_dir) / "maps"
-        maps_path.mkdir(exist_ok=True)
-        directories["maps"] = str(maps_path)
+    # Create subdirectories only for enabled outputs; the base already exists,
+    # so each is a single mkdir without re-walking the parents
+    enabled_subdirectories = {
+        "csv": export_csv,
+        "isochrones": export_isochrones,
+        "maps": create_maps,
+    }
+    for name, enabled in enabled_subdirectories.items():
+        if enabled:
+            subdirectory = Path(output_dir) / name
+            subdirectory.mkdir(exist_ok=True)
+            directories[name] = str(subdirectory)
 
     # Initialize invalid data tracker for this session
     reset_global_tracker(output_dir)
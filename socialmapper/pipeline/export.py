@@ -69,7 +69,7 @@ def export_pipeline_outputs(
         
         try:
             # Save isochrone GeoDataFrame to GeoParquet format
-            isochrone_gdf.to_parquet(isochrone_file, compression="snappy", index=False)
+            isochrone_gdf.to_parquet(isochrone_file, compression="zstd", index=False)
             result_files["isochrone_data"] = isochrone_file
             print(f"Exported isochrones to GeoParquet: {isochrone_file}")
             export_count += 1
@@ -6,10 +6,13 @@ This module handles extraction of POI data from custom files or OpenStreetMap.
 import csv
 import json
 import random
+import string
 from pathlib import Path
 from typing import Any
 from urllib.error import URLError
 
+from ..census import get_census_system
+from ..census.services.geography_service import StateFormat
 from ..exceptions import (
     FileNotFoundError as SocialMapperFileNotFoundError,
 )
@@ -17,9 +20,44 @@ from ..exceptions import (
     FileSystemError,
     NoDataFoundError,
 )
+from ..query import build_overpass_query, create_poi_config, format_results, query_overpass
 from ..util import PathSecurityError, sanitize_path
 from ..util.error_handling import validate_type
 
+# Columnar CSV parsing for custom coordinate files
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# orjson is optional; when available it is used to decode custom coordinate JSON
+try:
+    import orjson
+
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+# Lowercases ASCII letters and turns spaces into underscores in one pass
+_FILENAME_PART_TABLE = str.maketrans({" ": "_", **{c: c.lower() for c in string.ascii_uppercase}})
+
+# Custom CSV files are decoded with a leading byte-order mark stripped, so files
+# saved as Excel's "CSV UTF-8" have the same column names as plain UTF-8 ones
+CSV_ENCODING = "utf-8-sig"
+
+# Candidate coordinate columns for custom CSV files, in order of preference
+CSV_LAT_COLUMNS = ("lat", "latitude", "y")
+CSV_LON_COLUMNS = ("lon", "lng", "longitude", "x")
+
+# CSV columns that map to POI fields and are therefore not copied into tags
+CSV_RESERVED_COLUMNS = frozenset(
+    ("id", "name", *CSV_LAT_COLUMNS, *CSV_LON_COLUMNS, "state", "type")
+)
+
 
 def parse_custom_coordinates(
     file_path: str, name_field: str | None = None, type_field: str | None = None, preserve_original: bool = True
@@ -57,8 +95,7 @@ def parse_custom_coordinates(
     states_found = set()
 
     if file_extension == ".json":
-        with open(safe_file_path) as f:
-            data = json.load(f)
+        data = _load_json(safe_file_path)
 
         # Handle different possible JSON formats
         if isinstance(data, list):
@@ -119,67 +156,11 @@ def parse_custom_coordinates(
             pois = data["pois"]
 
     elif file_extension == ".csv":
-        # Use newline="" to ensure correct universal newline handling across platforms
-        with open(safe_file_path, newline="") as f:
-            reader = csv.DictReader(f)
-            for i, row in enumerate(reader):
-                # Try to find lat/lon in different possible column names
-                lat = None
-                lon = None
-
-                for lat_key in ["lat", "latitude", "y"]:
-                    if lat_key in row:
-                        lat = float(row[lat_key])
-                        break
-
-                for lon_key in ["lon", "lng", "longitude", "x"]:
-                    if lon_key in row:
-                        lon = float(row[lon_key])
-                        break
-
-                if lat is not None and lon is not None:
-                    # Use user-specified field for name if provided
-                    if name_field and name_field in row:
-                        name = row.get(name_field)
-                    else:
-                        name = row.get("name", f"Custom POI {i}")
-
-                    # Use user-specified field for type if provided
-                    poi_type = None
-                    if type_field and type_field in row:
-                        poi_type = row.get(type_field)
-                    else:
-                        poi_type = row.get("type", "custom")
-
-                    poi = {
-                        "id": row.get("id", f"custom_{i}"),
-                        "name": name,
-                        "type": poi_type,
-                        "lat": lat,
-                        "lon": lon,
-                        "tags": {},
-                    }
-
-                    # Add any additional columns as tags
-                    for key, value in row.items():
-                        if key not in [
-                            "id",
-                            "name",
-                            "lat",
-                            "latitude",
-                            "y",
-                            "lon",
-                            "lng",
-                            "longitude",
-                            "x",
-                            "state",
-                            "type",
-                        ]:
-                            poi["tags"][key] = value
-
-                    pois.append(poi)
-                else:
-                    print(f"Warning: Skipping row {i + 1} - missing required coordinates")
+        pois = None
+        if ARROW_AVAILABLE:
+            pois = _parse_custom_csv_columnar(safe_file_path, name_field, type_field)
+        if pois is None:
+            pois = _parse_custom_csv_rows(safe_file_path, name_field, type_field)
 
     else:
         raise ValueError(
@@ -202,6 +183,171 @@ def parse_custom_coordinates(
     }
 
 
+def _to_filename_part(value: str) -> str:
+    """Lowercase a name and replace spaces with underscores for use in a filename."""
+    if value.isascii():
+        return value.translate(_FILENAME_PART_TABLE)
+    return value.replace(" ", "_").lower()
+
+
+def _load_json(file_path: Path) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    if USE_ORJSON:
+        content = file_path.read_bytes()
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (e.g. NaN, oversized integers); fall back below
+            return json.loads(content)
+
+    with file_path.open() as f:
+        return json.load(f)
+
+
+def _parse_custom_csv_rows(
+    file_path: Path, name_field: str | None, type_field: str | None
+) -> list[dict]:
+    """Parse a custom coordinates CSV file row by row with the csv module.
+
+    Accepts anything csv.DictReader would: short rows read as None for the
+    missing columns, cells past the header are kept in ``tags[None]``, and
+    repeated header names resolve to the last column.
+
+    Args:
+        file_path: Path to the CSV file
+        name_field: Column to use for the POI name (if different from 'name')
+        type_field: Column to use for the POI type (if different from 'type')
+
+    Returns:
+        List of POI dictionaries
+    """
+    pois = []
+    # Use newline="" to ensure correct universal newline handling across platforms
+    with file_path.open(newline="", encoding=CSV_ENCODING) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        n_columns = len(header)
+
+        # Resolve column positions once from the header rather than probing
+        # every row (the last of any duplicate names wins, as with DictReader)
+        positions = {key: idx for idx, key in enumerate(header)}
+        lat_idx = next((positions[key] for key in CSV_LAT_COLUMNS if key in positions), None)
+        lon_idx = next((positions[key] for key in CSV_LON_COLUMNS if key in positions), None)
+        id_idx = positions.get("id")
+
+        # Use user-specified fields for name and type if provided
+        if name_field and name_field in positions:
+            name_idx = positions[name_field]
+        else:
+            name_idx = positions.get("name")
+        if type_field and type_field in positions:
+            type_idx = positions[type_field]
+        else:
+            type_idx = positions.get("type")
+
+        # Any additional columns become tags
+        tag_idxs = [(idx, key) for key, idx in positions.items() if key not in CSV_RESERVED_COLUMNS]
+
+        # Blank lines are skipped, as csv.DictReader does, so row numbers match
+        for i, row in enumerate(row for row in reader if row):
+            if lat_idx is None or lon_idx is None:
+                print(f"Warning: Skipping row {i + 1} - missing required coordinates")
+                continue
+
+            if len(row) < n_columns:
+                # Short rows read as None for the missing columns
+                row.extend([None] * (n_columns - len(row)))
+
+            tags = {key: row[idx] for idx, key in tag_idxs}
+            if len(row) > n_columns:
+                # Cells past the header are kept under a None key, as DictReader does
+                tags[None] = row[n_columns:]
+
+            pois.append(
+                {
+                    "id": row[id_idx] if id_idx is not None else f"custom_{i}",
+                    "name": row[name_idx] if name_idx is not None else f"Custom POI {i}",
+                    "type": row[type_idx] if type_idx is not None else "custom",
+                    "lat": float(row[lat_idx]),
+                    "lon": float(row[lon_idx]),
+                    "tags": tags,
+                }
+            )
+
+    return pois
+
+
+def _parse_custom_csv_columnar(
+    file_path: Path, name_field: str | None, type_field: str | None
+) -> list[dict] | None:
+    """Parse a custom coordinates CSV file with pyarrow's columnar reader.
+
+    Produces the same POIs as the row-by-row reader: every cell is read as a
+    string, coordinates are converted to floats a column at a time, and the
+    remaining columns become tags.
+
+    Args:
+        file_path: Path to the CSV file
+        name_field: Column to use for the POI name (if different from 'name')
+        type_field: Column to use for the POI type (if different from 'type')
+
+    Returns:
+        List of POI dictionaries, or None if the file has ragged rows or repeated
+        column names and must go through _parse_custom_csv_rows instead
+    """
+    # Read the header so every column can be pinned to string, matching csv.DictReader
+    with file_path.open(newline="", encoding=CSV_ENCODING) as f:
+        header = next(csv.reader(f), [])
+    if not header:
+        return []
+    if len(set(header)) != len(header):
+        # Repeated column names are left to the row reader (last one wins)
+        return None
+
+    try:
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(encoding=CSV_ENCODING),
+            convert_options=pa_csv.ConvertOptions(column_types=dict.fromkeys(header, pa.string())),
+        )
+    except pa.ArrowInvalid:
+        # Ragged rows: the row reader pads short rows and keeps extra cells
+        return None
+    n_rows = table.num_rows
+
+    # Look columns up by the names pyarrow actually produced
+    header = table.column_names
+
+    lat_col = next((key for key in CSV_LAT_COLUMNS if key in header), None)
+    lon_col = next((key for key in CSV_LON_COLUMNS if key in header), None)
+    if lat_col is None or lon_col is None:
+        for i in range(n_rows):
+            print(f"Warning: Skipping row {i + 1} - missing required coordinates")
+        return []
+
+    def column(name: str | None) -> list | None:
+        return table.column(name).to_pylist() if name in header else None
+
+    lats = pc.cast(pc.utf8_trim_whitespace(table.column(lat_col)), pa.float64()).to_pylist()
+    lons = pc.cast(pc.utf8_trim_whitespace(table.column(lon_col)), pa.float64()).to_pylist()
+    ids = column("id")
+    names = column(name_field) if name_field and name_field in header else column("name")
+    types = column(type_field) if type_field and type_field in header else column("type")
+    tag_columns = {key: column(key) for key in header if key not in CSV_RESERVED_COLUMNS}
+
+    return [
+        {
+            "id": ids[i] if ids is not None else f"custom_{i}",
+            "name": names[i] if names is not None else f"Custom POI {i}",
+            "type": types[i] if types is not None else "custom",
+            "lat": lats[i],
+            "lon": lons[i],
+            "tags": {key: values[i] for key, values in tag_columns.items()},
+        }
+        for i in range(n_rows)
+    ]
+
+
 def extract_poi_data(
     custom_coords_path: str | None = None,
     geocode_area: str | None = None,
@@ -219,10 +365,6 @@ def extract_poi_data(
     Returns:
         Tuple of (poi_data, base_filename, state_abbreviations, sampled_pois)
     """
-    from ..census import get_census_system
-    from ..census.services.geography_service import StateFormat
-    from ..query import build_overpass_query, create_poi_config, format_results, query_overpass
-
     # Get census system for state normalization
     census_system = get_census_system()
 
@@ -317,8 +459,8 @@ def extract_poi_data(
 
         # Generate base filename from POI configuration
         poi_type_str = config.get("type", "poi")
-        poi_name_str = config.get("name", "custom").replace(" ", "_").lower()
-        location = config.get("geocode_area", "").replace(" ", "_").lower()
+        poi_name_str = _to_filename_part(config.get("name", "custom"))
+        location = _to_filename_part(config.get("geocode_area", ""))
 
         if location:
             base_filename = f"{location}_{poi_type_str}_{poi_name_str}"
@@ -4,7 +4,7 @@ This module contains utility functions used across pipeline modules.
 """
 
 import geopandas as gpd
-from shapely.geometry import Point
+import numpy as np
 
 from ..util import PathSecurityError, sanitize_path
 
@@ -42,11 +42,16 @@ def convert_poi_to_geodataframe(poi_data_list):
     if not poi_data_list:
         return None
 
-    # Extract coordinates and create Point geometries
-    geometries = []
-    names = []
-    ids = []
-    types = []
+    # Fill preallocated columns (sized for every POI, trimmed to the valid ones
+    # afterwards); the Point geometries are built in a single vectorized call
+    # below rather than one Point per POI
+    n_pois = len(poi_data_list)
+    lons = np.empty(n_pois, dtype=np.float64)
+    lats = np.empty(n_pois, dtype=np.float64)
+    names = [None] * n_pois
+    ids = [None] * n_pois
+    types = [None] * n_pois
+    count = 0
 
     for poi in poi_data_list:
         if "lat" in poi and "lon" in poi:
@@ -59,19 +64,24 @@ def convert_poi_to_geodataframe(poi_data_list):
         else:
             continue
 
-        geometries.append(Point(lon, lat))
-        names.append(poi.get("name", poi.get("tags", {}).get("name", poi.get("id", "Unknown"))))
-        ids.append(poi.get("id", ""))
+        lons[count] = lon
+        lats[count] = lat
+        names[count] = poi.get("name", poi.get("tags", {}).get("name", poi.get("id", "Unknown")))
+        ids[count] = poi.get("id", "")
 
         # Check for type directly in the POI data first, then fallback to tags
         if "type" in poi:
-            types.append(poi.get("type"))
+            types[count] = poi.get("type")
         else:
-            types.append(poi.get("tags", {}).get("amenity", "Unknown"))
+            types[count] = poi.get("tags", {}).get("amenity", "Unknown")
+
+        count += 1
 
     # Create GeoDataFrame
     gdf = gpd.GeoDataFrame(
-        {"name": names, "id": ids, "type": types, "geometry": geometries}, crs="EPSG:4326"
+        {"name": names[:count], "id": ids[:count], "type": types[:count]},
+        geometry=gpd.points_from_xy(lons[:count], lats[:count]),
+        crs="EPSG:4326",
     )  # WGS84 is standard for GPS coordinates
 
     return gdf
@@ -21,6 +21,7 @@ def generate_isochrones(
     travel_time: int,
     state_abbreviations: list[str],
     travel_mode: TravelMode | None = None,
+    max_workers: int | None = None,
 ) -> gpd.GeoDataFrame:
     """Generate isochrones for the POI data.
 
@@ -29,6 +30,7 @@ def generate_isochrones(
         travel_time: Travel time in minutes
         state_abbreviations: List of state abbreviations
         travel_mode: Mode of travel (walk, bike, drive)
+        max_workers: Maximum concurrent isochrone calculations (defaults to CPU count)
 
     Returns:
         GeoDataFrame containing isochrones
@@ -50,6 +52,7 @@ def generate_isochrones(
                 save_individual_files=False,  # We want the GeoDataFrame directly
                 use_parquet=True,
                 travel_mode=travel_mode,
+                max_isochrone_workers=max_workers,
             )
     except Exception as e:
         # Check for common network-related errors
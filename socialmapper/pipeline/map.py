@@ -10,6 +10,7 @@ from typing import Any
 import geopandas as gpd
 import matplotlib.pyplot as plt
 
+from ..census.utils import clean_census_value
 from ..constants import (
     CITY_SCALE_DISTANCE_M,
     METRO_SCALE_DISTANCE_M,
@@ -19,6 +20,7 @@ from ..constants import (
 from ..progress import get_progress_bar
 from ..visualization import ChoroplethMap, ColorScheme, MapConfig, MapType
 from ..visualization.config import ClassificationScheme, LegendConfig
+from .helpers import convert_poi_to_geodataframe
 
 
 def create_pipeline_maps(
@@ -76,11 +78,14 @@ def create_pipeline_maps(
     output_paths = {}
     map_count = 0
 
+    # Look up the distance column once; it decides both the map count and the map itself
+    distance_column = _get_distance_column(census_data_gdf) if create_distance_map else None
+
     # Calculate total maps to create for progress tracking
     total_maps = 0
     if create_demographic_maps:
         total_maps += len(census_variables)
-    if create_distance_map and _has_distance_data(census_data_gdf):
+    if distance_column:
         total_maps += 1
     if create_accessibility_map and isochrone_gdf is not None:
         total_maps += 1
@@ -118,24 +123,22 @@ def create_pipeline_maps(
                     pbar.update(1)
 
         # Create distance map
-        if create_distance_map and _has_distance_data(census_data_gdf):
+        if distance_column:
             try:
-                distance_column = _get_distance_column(census_data_gdf)
-                if distance_column:
-                    map_path = _create_distance_map(
-                        census_data_gdf,
-                        distance_column,
-                        poi_gdf,
-                        output_path,
-                        base_filename,
-                        travel_time,
-                        geographic_level,
-                        map_format,
-                        dpi,
-                    )
-                    output_paths["distance"] = map_path
-                    map_count += 1
-                    print("✅ Created distance map")
+                map_path = _create_distance_map(
+                    census_data_gdf,
+                    distance_column,
+                    poi_gdf,
+                    output_path,
+                    base_filename,
+                    travel_time,
+                    geographic_level,
+                    map_format,
+                    dpi,
+                )
+                output_paths["distance"] = map_path
+                map_count += 1
+                print("✅ Created distance map")
                 pbar.update(1)
             except Exception as e:
                 print(f"⚠️ Failed to create distance map: {e}")
@@ -172,8 +175,6 @@ def create_pipeline_maps(
 
 def _convert_poi_to_geodataframe(poi_data: dict[str, Any]) -> gpd.GeoDataFrame | None:
     """Convert POI data to GeoDataFrame."""
-    from .helpers import convert_poi_to_geodataframe
-
     if poi_data.get("pois"):
         return convert_poi_to_geodataframe(poi_data["pois"])
     return None
@@ -263,17 +264,6 @@ def _detect_census_variables(gdf: gpd.GeoDataFrame) -> list[str]:
     return census_variables[:5]
 
 
-def _has_distance_data(gdf: gpd.GeoDataFrame) -> bool:
-    """Check if GeoDataFrame has distance data."""
-    distance_columns = [
-        "travel_distance_km",
-        "travel_distance_miles",
-        "distance_km",
-        "distance_miles",
-    ]
-    return any(col in gdf.columns for col in distance_columns)
-
-
 def _get_distance_column(gdf: gpd.GeoDataFrame) -> str | None:
     """Get the distance column name."""
     preferred_columns = [
@@ -288,6 +278,27 @@ def _get_distance_column(gdf: gpd.GeoDataFrame) -> str | None:
     return None
 
 
+def _calculate_zoom_level(gdf: gpd.GeoDataFrame, poi_gdf: gpd.GeoDataFrame | None) -> int:
+    """Pick a basemap zoom level from the extent of the POIs, or of gdf if there are none."""
+    # Use POI bounds for better centering, falling back to census data bounds
+    bbox = poi_gdf.total_bounds if poi_gdf is not None and not poi_gdf.empty else gdf.total_bounds
+
+    # Calculate diagonal for better area estimation
+    bbox_diagonal = ((bbox[2] - bbox[0]) ** 2 + (bbox[3] - bbox[1]) ** 2) ** 0.5
+
+    # Improved zoom level calculation for Web Mercator
+    # These values work well for US geography
+    if bbox_diagonal < CITY_SCALE_DISTANCE_M:  # neighborhood/small city
+        return 12
+    if bbox_diagonal < METRO_SCALE_DISTANCE_M:  # city/metro area
+        return 11
+    if bbox_diagonal < REGIONAL_SCALE_DISTANCE_M:  # large metro/small region
+        return 10
+    if bbox_diagonal < STATE_SCALE_DISTANCE_M:  # region/small state
+        return 9
+    return 8  # Large area - state or bigger
+
+
 def _create_demographic_map(
     gdf: gpd.GeoDataFrame,
     variable: str,
@@ -301,8 +312,6 @@ def _create_demographic_map(
     dpi: int,
 ) -> Path:
     """Create a demographic choropleth map."""
-    from ..census.utils import clean_census_value
-
     # Clean the data before creating the map
     gdf = gdf.copy()
     if variable in gdf.columns:
@@ -327,32 +336,7 @@ def _create_demographic_map(
     color_scheme = _get_color_scheme_for_variable(variable)
 
     # Calculate appropriate zoom level based on POI extent if available
-    if poi_gdf is not None and not poi_gdf.empty:
-        # Use POI bounds for better centering
-        poi_bounds = poi_gdf.total_bounds
-        bbox_width = poi_bounds[2] - poi_bounds[0]
-        bbox_height = poi_bounds[3] - poi_bounds[1]
-    else:
-        # Fall back to census data bounds
-        bbox = gdf.total_bounds
-        bbox_width = bbox[2] - bbox[0]
-        bbox_height = bbox[3] - bbox[1]
-
-    # Calculate diagonal for better area estimation
-    bbox_diagonal = (bbox_width**2 + bbox_height**2) ** 0.5
-
-    # Improved zoom level calculation for Web Mercator
-    # These values work well for US geography
-    if bbox_diagonal < CITY_SCALE_DISTANCE_M:  # neighborhood/small city
-        zoom_level = 12
-    elif bbox_diagonal < METRO_SCALE_DISTANCE_M:  # city/metro area
-        zoom_level = 11
-    elif bbox_diagonal < REGIONAL_SCALE_DISTANCE_M:  # large metro/small region
-        zoom_level = 10
-    elif bbox_diagonal < STATE_SCALE_DISTANCE_M:  # region/small state
-        zoom_level = 9
-    else:  # Large area - state or bigger
-        zoom_level = 8
+    zoom_level = _calculate_zoom_level(gdf, poi_gdf)
 
     # Create configuration
     config = MapConfig(
@@ -414,31 +398,7 @@ def _create_distance_map(
     title = f"Travel Distance to Nearest POI by {unit_label}"
 
     # Calculate appropriate zoom level based on POI extent if available
-    if poi_gdf is not None and not poi_gdf.empty:
-        # Use POI bounds for better centering
-        poi_bounds = poi_gdf.total_bounds
-        bbox_width = poi_bounds[2] - poi_bounds[0]
-        bbox_height = poi_bounds[3] - poi_bounds[1]
-    else:
-        # Fall back to census data bounds
-        bbox = gdf.total_bounds
-        bbox_width = bbox[2] - bbox[0]
-        bbox_height = bbox[3] - bbox[1]
-
-    # Calculate diagonal for better area estimation
-    bbox_diagonal = (bbox_width**2 + bbox_height**2) ** 0.5
-
-    # Improved zoom level calculation for Web Mercator
-    if bbox_diagonal < 50000:  # < 50km
-        zoom_level = 12
-    elif bbox_diagonal < 100000:  # < 100km
-        zoom_level = 11
-    elif bbox_diagonal < 200000:  # < 200km
-        zoom_level = 10
-    elif bbox_diagonal < 400000:  # < 400km
-        zoom_level = 9
-    else:
-        zoom_level = 8
+    zoom_level = _calculate_zoom_level(gdf, poi_gdf)
 
     # Create configuration
     config = MapConfig(
@@ -488,31 +448,7 @@ def _create_accessibility_map(
     title = f"{variable_name} within {travel_time}-Minute Travel Time"
 
     # Calculate appropriate zoom level based on POI extent if available
-    if poi_gdf is not None and not poi_gdf.empty:
-        # Use POI bounds for better centering
-        poi_bounds = poi_gdf.total_bounds
-        bbox_width = poi_bounds[2] - poi_bounds[0]
-        bbox_height = poi_bounds[3] - poi_bounds[1]
-    else:
-        # Fall back to census data bounds
-        bbox = gdf.total_bounds
-        bbox_width = bbox[2] - bbox[0]
-        bbox_height = bbox[3] - bbox[1]
-
-    # Calculate diagonal for better area estimation
-    bbox_diagonal = (bbox_width**2 + bbox_height**2) ** 0.5
-
-    # Improved zoom level calculation for Web Mercator
-    if bbox_diagonal < 50000:  # < 50km
-        zoom_level = 12
-    elif bbox_diagonal < 100000:  # < 100km
-        zoom_level = 11
-    elif bbox_diagonal < 200000:  # < 200km
-        zoom_level = 10
-    elif bbox_diagonal < 400000:  # < 400km
-        zoom_level = 9
-    else:
-        zoom_level = 8
+    zoom_level = _calculate_zoom_level(gdf, poi_gdf)
 
     # Create configuration
     config = MapConfig(
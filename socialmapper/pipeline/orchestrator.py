@@ -51,6 +51,7 @@ class PipelineConfig:
     geographic_level: str = "block-group"
     census_variables: list[str] = field(default_factory=lambda: ["total_population"])
     api_key: str | None = None
+    max_workers: int | None = None
 
     # Output configuration
     output_dir: str = "output"
@@ -205,6 +206,7 @@ class PipelineOrchestrator:
             travel_time=self.config.travel_time,
             state_abbreviations=state_abbreviations,
             travel_mode=travel_mode,
+            max_workers=self.config.max_workers,
         )
 
     def _integrate_census(self):
@@ -5,17 +5,35 @@ import argparse
 import json
 import os
 import sys
+import threading
+from collections import OrderedDict
 from typing import Any, Optional
 
 import overpy
 import yaml
 
+from ..census.infrastructure.cache import FileCacheProvider
+from ..constants import DEFAULT_CACHE_TTL_HOURS
+
 # Configure logger
 from ..ui.console import get_logger
 from ..util import with_retry
 
 logger = get_logger(__name__)
 
+# Raw Overpass results keyed by query text, so repeating an identical query in
+# the same process skips the API round-trip
+_OVERPASS_CACHE_SIZE = 32
+_overpass_cache: OrderedDict[str, overpy.Result] = OrderedDict()
+_overpass_cache_lock = threading.Lock()
+
+# Results also persist on disk between runs, keyed by a hash of the query text;
+# OSM edits are infrequent enough that a day-old answer is still useful
+_OVERPASS_DISK_CACHE_DIR = "cache/overpass"
+# Created on first use under the lock, keyed by directory, so no global rebinding
+_overpass_disk_caches: dict[str, FileCacheProvider] = {}
+_overpass_disk_cache_lock = threading.Lock()
+
 
 def create_poi_config(geocode_area, state, city, poi_type, poi_name, additional_tags=None):
     """Create a POI configuration dictionary directly from parameters.
@@ -173,13 +191,80 @@ def build_overpass_query(poi_config):
     return query
 
 
-@with_retry(max_retries=3, base_delay=2.0, service="openstreetmap")
-def query_overpass(query):
+def query_overpass(query, use_cache=True):
     """Query the Overpass API with the given query.
 
     Uses rate limiting and retry logic to handle transient errors
-    and respect API usage limits.
+    and respect API usage limits. Results are memoized per query string
+    in process and on disk unless ``use_cache`` is False.
     """
+    if use_cache:
+        with _overpass_cache_lock:
+            result = _overpass_cache.get(query)
+            if result is not None:
+                _overpass_cache.move_to_end(query)
+                logger.info("Using cached Overpass API result")
+                return result
+
+        disk_cache = _get_overpass_disk_cache()
+        try:
+            entry = disk_cache.get(query)
+        except Exception as e:
+            # Entries are pickled overpy objects; one written by another overpy
+            # version can fail to load in many ways, so treat it as a miss
+            logger.warning(f"Discarding unreadable Overpass disk cache entry: {e}")
+            disk_cache.delete(query)
+            entry = None
+        if entry is not None:
+            logger.info("Using Overpass API result cached on disk")
+            result = entry.data
+            _remember_overpass_result(query, result)
+            return result
+
+    result = _fetch_overpass(query)
+
+    if use_cache:
+        _remember_overpass_result(query, result)
+        try:
+            _get_overpass_disk_cache().set(
+                query, result, ttl=DEFAULT_CACHE_TTL_HOURS * 3600
+            )
+        except RuntimeError as e:
+            logger.warning(f"Could not write Overpass result to disk cache: {e}")
+
+    return result
+
+
+def clear_overpass_cache():
+    """Clear the in-process and on-disk caches of Overpass API results."""
+    with _overpass_cache_lock:
+        _overpass_cache.clear()
+    _get_overpass_disk_cache().clear()
+
+
+def _remember_overpass_result(query, result):
+    """Store a result in the in-process cache, evicting the oldest entries."""
+    with _overpass_cache_lock:
+        _overpass_cache[query] = result
+        while len(_overpass_cache) > _OVERPASS_CACHE_SIZE:
+            _overpass_cache.popitem(last=False)
+
+
+def _get_overpass_disk_cache() -> FileCacheProvider:
+    """Return the on-disk Overpass cache, creating it once on first use."""
+    cache = _overpass_disk_caches.get(_OVERPASS_DISK_CACHE_DIR)
+    if cache is None:
+        with _overpass_disk_cache_lock:
+            cache = _overpass_disk_caches.get(_OVERPASS_DISK_CACHE_DIR)
+            if cache is None:
+                cache = FileCacheProvider(cache_dir=_OVERPASS_DISK_CACHE_DIR)
+                _overpass_disk_caches[_OVERPASS_DISK_CACHE_DIR] = cache
+    return cache
+
+
+@with_retry(max_retries=3, base_delay=2.0, service="openstreetmap")
+def _fetch_overpass(query):
+    """Send a query to the Overpass API."""
     api = overpy.Overpass(url="https://overpass-api.de/api/interpreter")
     try:
         logger.info("Sending query to Overpass API...")
@@ -8,7 +8,8 @@ to ensure data quality and prevent issues with PyProj transformations.
 from typing import Any
 
 import geopandas as gpd
-from pydantic import BaseModel, ValidationError, field_validator
+import numpy as np
+from pydantic import BaseModel, TypeAdapter, ValidationError, field_validator
 from shapely.geometry import Point
 
 from ..constants import (
@@ -83,6 +84,10 @@ class StrictCoordinate(BaseModel):
         return float(v)
 
 
+# Bulk constructor for coordinate lists; extra POI keys are ignored
+_COORDINATE_LIST = TypeAdapter(list[Coordinate])
+
+
 class CoordinateCluster(BaseModel):
     """Validates a cluster of coordinates for distance calculations."""
 
@@ -166,6 +171,11 @@ def validate_poi_coordinates(poi_data: dict[str, Any] | list[dict[str, Any]]) ->
     # Handle single POI or list of POIs
     pois = poi_data if isinstance(poi_data, list) else [poi_data]
 
+    # Common case: every POI has numeric lat/lon fields that are all in range
+    fast_result = _validate_numeric_lat_lon(pois)
+    if fast_result is not None:
+        return fast_result
+
     for i, poi in enumerate(pois):
         try:
             # Multiple coordinate format possibilities
@@ -249,6 +259,50 @@ def validate_poi_coordinates(poi_data: dict[str, Any] | list[dict[str, Any]]) ->
     )
 
 
+def _validate_numeric_lat_lon(pois: list[dict[str, Any]]) -> ValidationResult | None:
+    """Bounds-check plain numeric lat/lon POIs in one vectorized pass.
+
+    Args:
+        pois: List of POI dictionaries
+
+    Returns:
+        ValidationResult if every POI has in-range numeric ``lat``/``lon`` fields,
+        None if any POI needs the per-POI path (other formats or invalid values)
+    """
+    # Exact type checks: strings and bools take the per-POI path, as before
+    numeric_types = (float, int)
+    for poi in pois:
+        if not isinstance(poi, dict):
+            return None
+        if type(poi.get("lat")) not in numeric_types or type(poi.get("lon")) not in numeric_types:
+            return None
+
+    n = len(pois)
+    lats = np.fromiter((poi["lat"] for poi in pois), dtype=np.float64, count=n)
+    lons = np.fromiter((poi["lon"] for poi in pois), dtype=np.float64, count=n)
+
+    # NaN fails both comparisons, so it is rejected along with out-of-range values
+    in_range = (
+        (lats >= MIN_LATITUDE)
+        & (lats <= MAX_LATITUDE)
+        & (lons >= MIN_LONGITUDE)
+        & (lons <= MAX_LONGITUDE)
+    )
+    if not in_range.all():
+        return None
+
+    # Every value is known to be valid, so build the models in one bulk call
+    coords = _COORDINATE_LIST.validate_python(pois)
+    return ValidationResult(
+        valid_coordinates=coords,
+        invalid_coordinates=[],
+        validation_errors=[],
+        total_input=n,
+        total_valid=n,
+        total_invalid=0,
+    )
+
+
 def validate_coordinate_cluster(coordinates: list[dict[str, Any]], cluster_id: str | None = None) -> CoordinateCluster:
     """Validate a cluster of coordinates.
 
@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
-import mapclassify
 import matplotlib.pyplot as plt
 
 try:
@@ -142,6 +141,10 @@ class ChoroplethMap:
         valid_data = self._gdf[~missing_mask][column]
 
         if len(valid_data) > 0:
+            # mapclassify is imported here rather than at module level: importing it
+            # dominates the package's import time and only map rendering needs it
+            import mapclassify
+
             # Create classification
             if self.config.classification_scheme == ClassificationScheme.DEFINED_INTERVAL:
                 # For defined interval, we need to specify intervals
@@ -0,0 +1,81 @@
+"""Tests for custom coordinate parsing in the pipeline extraction stage."""
+
+import pytest
+
+from socialmapper.pipeline.extraction import (
+    _parse_custom_csv_columnar,
+    _parse_custom_csv_rows,
+    parse_custom_coordinates,
+)
+
+
+def _write_csv(tmp_path, text):
+    path = tmp_path / "pois.csv"
+    path.write_text(text)
+    return path
+
+
+def test_csv_short_row_reads_missing_columns_as_none(tmp_path):
+    path = _write_csv(tmp_path, "name,lat,lon,category\nA,35.0,-78.0,park\nB,36.0,-79.0\n")
+
+    pois = parse_custom_coordinates(str(path))["pois"]
+
+    assert [poi["name"] for poi in pois] == ["A", "B"]
+    assert pois[1]["lat"] == 36.0
+    assert pois[1]["tags"] == {"category": None}
+
+
+def test_csv_repeated_header_uses_last_column(tmp_path):
+    path = _write_csv(tmp_path, "name,lat,lon,lat\nA,1.0,-78.0,35.0\n")
+
+    pois = parse_custom_coordinates(str(path))["pois"]
+
+    assert len(pois) == 1
+    assert pois[0]["lat"] == 35.0
+    assert pois[0]["lon"] == -78.0
+
+
+def test_csv_columnar_defers_irregular_files_to_row_reader(tmp_path):
+    ragged = _write_csv(tmp_path, "name,lat,lon\nA,35.0\n")
+    assert _parse_custom_csv_columnar(ragged, None, None) is None
+
+    repeated = tmp_path / "repeated.csv"
+    repeated.write_text("name,lat,lon,name\nA,35.0,-78.0,B\n")
+    assert _parse_custom_csv_columnar(repeated, None, None) is None
+
+
+@pytest.mark.parametrize("bom", ["", "\ufeff"], ids=["plain", "utf8-bom"])
+def test_csv_columnar_and_row_readers_agree(tmp_path, bom):
+    path = _write_csv(
+        tmp_path,
+        f"{bom}id,title,latitude,lng,kind,category\n"
+        "p1,Library, 35.5 ,-78.5,civic,books\n"
+        "\n"
+        "p2,Park,36.0,-79.0,green,\n",
+    )
+
+    columnar = _parse_custom_csv_columnar(path, "title", "kind")
+    rows = _parse_custom_csv_rows(path, "title", "kind")
+
+    assert columnar == rows
+    assert [poi["id"] for poi in rows] == ["p1", "p2"]
+    assert [poi["name"] for poi in rows] == ["Library", "Park"]
+    assert [poi["type"] for poi in rows] == ["civic", "green"]
+
+
+def test_csv_with_bom_keeps_first_column_name(tmp_path):
+    path = _write_csv(tmp_path, "\ufeffname,lat,lon\nA,35.0,-78.0\n")
+
+    pois = parse_custom_coordinates(str(path))["pois"]
+
+    assert pois[0]["name"] == "A"
+    assert pois[0]["tags"] == {}
+
+
+def test_csv_long_row_keeps_extra_cells_under_none(tmp_path):
+    path = _write_csv(tmp_path, "name,lat,lon\nA,35.0,-78.0,extra1,extra2\nB,36.0,-79.0\n")
+
+    pois = parse_custom_coordinates(str(path))["pois"]
+
+    assert pois[0]["tags"] == {None: ["extra1", "extra2"]}
+    assert pois[1]["tags"] == {}